@@ -84,72 +84,77 @@ class Agent:
             interactive: bool = False,
             selection: Optional[str] = None,
             prev_state: Optional[Dict] = None,
+            api_client: Optional[ApiClient] = None,
     ) -> Dict:
-        """Запуск графа LangGraph и пост-обработка результата."""
-        async with ApiClient(base_url=BACKEND_URL) as api_client:
-            # -------- 2. Подготовка начального состояния ------------
-            if prev_state:
-                state = AgentState(**prev_state)
-            else:
-                state = AgentState(messages=[{"role": "user", "content": input_text}])
-
-            # -------- 3. Обработка inline-selection -----------------
-            if selection:
-                if selection.startswith("CS:"):
-                    field, value = selection[3:].split("=", 1)
-                    for req in state.requests:
-                        req["entities"][field] = value
-                        req["missing"] = [m for m in req["missing"] if m != field]
-                elif selection.startswith("cancel"):
-                    return {"messages": [], "output": []}
-
-            # -------- 4. Запуск графа --------------------------------
-            try:
-                result = await self.graph.ainvoke(state.dict())
-            except Exception:
-                agent_logger.exception("[RUN] Graph failed")
-                return {
-                    "messages": [
-                        {"text": "Не удалось обработать запрос. Попробуйте снова.", "request_indices": []}
-                    ],
-                    "output": [],
-                }
-
-            # -------- 5. Формирование output-словаря -----------------
-            output_dict = result.get("output", {})  # всегда dict из response_agent
-
-            # При interactive добавляем полный state внутрь output_dict
-            if interactive:
-                output_dict["state"] = {
-                    k: result[k]
-                    for k in (
-                        "messages",
-                        "requests",
-                        "actions",
-                        "combine_responses",
-                        "parse_iterations",
-                        "metadata",
-                    )
-                }
-
-            # -------- 6. Логирование JSON-выгрузки -------------------
-            agent_logger.debug(
-                f"[RUN] Result output: {json.dumps(output_dict, indent=2, ensure_ascii=False)}"
-            )
-
-            # -------- 7. Резюме для каждой операции -----------------
-            for out in output_dict.get("output", []):
-                if not isinstance(out.get("entities"), dict):
-                    agent_logger.error(
-                        f"[RUN] Invalid entities type for output: {type(out.get('entities'))}, "
-                        f"value: {out.get('entities')}"
-                    )
-                    continue
-                msg = await format_operation_message(out["entities"], api_client)
-                agent_logger.info(f"[SUMMARY]\n{msg}")
-
-            # -------- 8. Возврат только output-словаря --------------
-            return output_dict
+        """
+        Запуск графа LangGraph и пост-обработка результата.
+        `api_client` — уже открытый клиент вызывающего; иначе берётся общий ApiClient.instance().
+        """
+        api_client = api_client or ApiClient.instance(BACKEND_URL)
+        # -------- 2. Подготовка начального состояния ------------
+        if prev_state:
+            state = AgentState(**prev_state)
+        else:
+            state = AgentState(messages=[{"role": "user", "content": input_text}])
+
+        # -------- 3. Обработка inline-selection -----------------
+        if selection:
+            if selection.startswith("CS:"):
+                field, value = selection[3:].split("=", 1)
+                for req in state.requests:
+                    req["entities"][field] = value
+                    req["missing"] = [m for m in req["missing"] if m != field]
+            elif selection.startswith("cancel"):
+                return {"messages": [], "output": []}
+
+        # -------- 4. Запуск графа --------------------------------
+        try:
+            result = await self.graph.ainvoke(state.dict())
+        except Exception:
+            agent_logger.exception("[RUN] Graph failed")
+            return {
+                "messages": [
+                    {"text": "Не удалось обработать запрос. Попробуйте снова.", "request_indices": []}
+                ],
+                "output": [],
+            }
+
+        # -------- 5. Формирование output-словаря -----------------
+        output_dict = result.get("output", {})  # всегда dict из response_agent
+
+        # При interactive добавляем полный state внутрь output_dict
+        if interactive:
+            output_dict["state"] = {
+                k: result[k]
+                for k in (
+                    "messages",
+                    "requests",
+                    "actions",
+                    "combine_responses",
+                    "parse_iterations",
+                    "metadata",
+                )
+            }
+
+        # -------- 6. Логирование JSON-выгрузки -------------------
+        agent_logger.opt(lazy=True).debug(
+            "[RUN] Result output: {}", lambda: json.dumps(output_dict, indent=2, ensure_ascii=False)
+        )
+
+        # -------- 7. Резюме для каждой операции -----------------
+        for out in output_dict.get("output", []):
+            if not isinstance(out.get("entities"), dict):
+                agent_logger.error(
+                    "[RUN] Invalid entities type for output: {}, "
+                    "value: {}",
+                    type(out.get('entities')), out.get('entities')
+                )
+                continue
+            msg = await format_operation_message(out["entities"], api_client)
+            agent_logger.info("[SUMMARY]\n{}", msg)
+
+        # -------- 8. Возврат только output-словаря --------------
+        return output_dict
 
     # -------------------------------------------------------------- #
     # 1.5 Публичный метод-обёртка                                     #
@@ -160,6 +165,7 @@ class Agent:
             interactive: bool = False,
             selection: Optional[str] = None,
             prev_state: Optional[Dict] = None,
+            api_client: Optional[ApiClient] = None,
     ) -> Dict:
         """
         Сбрасывает кэш метаданных и вызывает `run()`.
@@ -170,4 +176,4 @@ class Agent:
         category_cache.clear()
         subcategory_cache.clear()
 
-        return await self.run(input_text, interactive, selection, prev_state)
+        return await self.run(input_text, interactive, selection, prev_state, api_client=api_client)
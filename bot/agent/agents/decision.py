@@ -9,7 +9,7 @@ from config import BACKEND_URL, OPENAI_API_KEY
 
 
 async def decision_agent(state: AgentState) -> AgentState:
-    async with ApiClient(base_url=BACKEND_URL) as api_client:
+    async with ApiClient.instance(BACKEND_URL) as api_client:
         agent_logger.info("[DECISION] Entering decision_agent")
         actions = []
         combine_responses = True
@@ -17,11 +17,11 @@ async def decision_agent(state: AgentState) -> AgentState:
 
         # Initialize OpenAI client
         agent_logger.debug(
-            f"Initializing OpenAI client with API key: {'*' * len(OPENAI_API_KEY[:-4]) + OPENAI_API_KEY[-4:]}")
+            "Initializing OpenAI client with API key: {}", '*' * len(OPENAI_API_KEY[:-4]) + OPENAI_API_KEY[-4:])
         try:
             openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
         except Exception as e:
-            agent_logger.error(f"Failed to initialize OpenAI client: {e}")
+            agent_logger.error("Failed to initialize OpenAI client: {}", e)
             raise
 
         # Prepare input for LLM
@@ -34,7 +34,7 @@ async def decision_agent(state: AgentState) -> AgentState:
                     req["entities"] = entities
                     agent_logger.info("[DECISION] Deserialized entities from string to dict")
                 except json.JSONDecodeError:
-                    agent_logger.error(f"[DECISION] Failed to deserialize entities: {entities}")
+                    agent_logger.error("[DECISION] Failed to deserialize entities: {}", entities)
                     continue
             requests.append({
                 "intent": req["intent"],
@@ -55,7 +55,9 @@ async def decision_agent(state: AgentState) -> AgentState:
             response_content = response.choices[0].message.content
             response_data = json.loads(response_content)
             agent_logger.info("[DECISION] Received OpenAI response")
-            agent_logger.debug(f"[DECISION] OpenAI response: {json.dumps(response_data, indent=2, ensure_ascii=False)}")
+            agent_logger.opt(lazy=True).debug(
+                "[DECISION] OpenAI response: {}", lambda: json.dumps(response_data, indent=2, ensure_ascii=False)
+            )
 
             actions = response_data.get("actions", [])
             combine_responses = response_data.get("combine_responses", True)
@@ -106,7 +108,7 @@ async def decision_agent(state: AgentState) -> AgentState:
                         action["ready_for_output"] = False
 
         except Exception as e:
-            agent_logger.exception(f"[DECISION] LLM processing failed: {e}")
+            agent_logger.exception("[DECISION] LLM processing failed: {}", e)
             # Fallback to basic logic
             required_fields = {
                 "add_income": ["category_code", "date", "amount", "comment"],
@@ -138,7 +140,7 @@ async def decision_agent(state: AgentState) -> AgentState:
         state.actions = actions
         state.combine_responses = combine_responses
         state.requests = [dict(req, missing=req.get("missing", [])) for req in state.requests]
-        agent_logger.info(f"[DECISION] Generated {len(actions)} actions: {actions}, combine: {combine_responses}")
+        agent_logger.info("[DECISION] Generated {} actions: {}, combine: {}", len(actions), actions, combine_responses)
 
         response = {
             "actions": actions,
@@ -146,6 +148,8 @@ async def decision_agent(state: AgentState) -> AgentState:
         }
         state.messages.append({"role": "assistant", "content": json.dumps(response, ensure_ascii=False)})
         agent_logger.info("[DECISION] Generated response")
-        agent_logger.debug(f"[DECISION] Response: {json.dumps(response, indent=2, ensure_ascii=False)}")
+        agent_logger.opt(lazy=True).debug(
+            "[DECISION] Response: {}", lambda: json.dumps(response, indent=2, ensure_ascii=False)
+        )
 
         return state
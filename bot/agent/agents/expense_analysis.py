@@ -7,7 +7,7 @@ from ..utils import AgentState, openai_client, agent_logger
 from ...api_client import ApiClient
 
 async def expense_analysis_agent(state: AgentState) -> AgentState:
-    async with ApiClient(base_url=BACKEND_URL) as api_client:
+    async with ApiClient.instance(BACKEND_URL) as api_client:
         agent_logger.info("[EXPENSE_ANALYSIS] Entering analytic_agent")
 
         try:
@@ -17,10 +17,10 @@ async def expense_analysis_agent(state: AgentState) -> AgentState:
                 entities = request["entities"]
 
                 if intent != "get_analytics" or action.get("needs_clarification"):
-                    agent_logger.debug(f"[EXPENSE_ANALYSIS] Skipping request {action['request_index']}")
+                    agent_logger.debug("[EXPENSE_ANALYSIS] Skipping request {}", action['request_index'])
                     continue
 
-                agent_logger.debug(f"[EXPENSE_ANALYSIS] Processing request: {action['request_index']}")
+                agent_logger.debug("[EXPENSE_ANALYSIS] Processing request: {}", action['request_index'])
 
                 period = entities["period"]
                 analytics_data = None
@@ -96,7 +96,7 @@ async def expense_analysis_agent(state: AgentState) -> AgentState:
                         "text", "Ошибка анализа данных."
                     )
 
-                    agent_logger.debug(f"[EXPENSE_ANALYSIS] LLM response: {analysis_text}")
+                    agent_logger.debug("[EXPENSE_ANALYSIS] LLM response: {}", analysis_text)
 
                     state.output.setdefault("messages", []).append({
                         "text": analysis_text,
@@ -106,7 +106,7 @@ async def expense_analysis_agent(state: AgentState) -> AgentState:
                     state.actions[i] = action
 
                 except Exception as e:
-                    agent_logger.error(f"[EXPENSE_ANALYSIS] LLM error: {e}")
+                    agent_logger.error("[EXPENSE_ANALYSIS] LLM error: {}", e)
                     state.output.setdefault("messages", []).append({
                         "text": "Ошибка анализа данных. Попробуйте снова.",
                         "request_indices": [action["request_index"]]
@@ -115,7 +115,7 @@ async def expense_analysis_agent(state: AgentState) -> AgentState:
                     state.actions[i] = action
 
         except Exception as e:
-            agent_logger.exception(f"[EXPENSE_ANALYSIS] Error: {e}")
+            agent_logger.exception("[EXPENSE_ANALYSIS] Error: {}", e)
             state.output = {
                 "messages": [{"text": "Ошибка анализа расходов. Попробуйте снова.", "request_indices": []}],
                 "output": []
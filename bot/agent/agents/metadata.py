@@ -18,10 +18,10 @@ async def metadata_agent(state: AgentState) -> AgentState:
         "date_cols": {},
     }
 
-    async with ApiClient(base_url=BACKEND_URL) as api_client:
+    async with ApiClient.instance(BACKEND_URL) as api_client:
         try:
             # Fetch full metadata
-            full_metadata = await api_client.get_metadata()
+            full_metadata = await api_client.get_metadata_cached()
             if not full_metadata:
                 agent_logger.error("[METADATA] API returned empty metadata")
                 state.output = {
@@ -31,7 +31,7 @@ async def metadata_agent(state: AgentState) -> AgentState:
                     "output": [],
                 }
                 return state
-            agent_logger.info(f"[METADATA] Fetched metadata: {len(full_metadata.get('expenses', {}))} sections")
+            agent_logger.info("[METADATA] Fetched metadata: {} sections", len(full_metadata.get('expenses', {})))
 
             # Validate entities
             for i, action in enumerate(state.actions):
@@ -218,13 +218,15 @@ async def metadata_agent(state: AgentState) -> AgentState:
                     action["ready_for_output"] = not bool(missing)
                     state.requests[action["request_index"]] = request
                     state.actions[i] = action
-                    agent_logger.info(f"[METADATA] Validated request {action['request_index']}")
-                    agent_logger.debug(
-                        f"[METADATA] Validated request {action['request_index']}: "
-                        f"entities={json.dumps(entities, ensure_ascii=False)}, missing={missing}"
+                    agent_logger.info("[METADATA] Validated request {}", action['request_index'])
+                    agent_logger.opt(lazy=True).debug(
+                        "[METADATA] Validated request {}: entities={}, missing={}",
+                        lambda: action['request_index'],
+                        lambda: json.dumps(entities, ensure_ascii=False),
+                        lambda: missing
                     )
                 except Exception as e:
-                    agent_logger.exception(f"[METADATA] Error validating entities: {e}")
+                    agent_logger.exception("[METADATA] Error validating entities: {}", e)
                     state.output = {
                         "messages": [
                             {
@@ -420,7 +422,7 @@ async def metadata_agent(state: AgentState) -> AgentState:
             )
             agent_logger.info("[METADATA] Metadata agent completed")
         except Exception as e:
-            agent_logger.exception(f"[METADATA] Error in metadata_agent: {e}")
+            agent_logger.exception("[METADATA] Error in metadata_agent: {}", e)
             state.output = {
                 "messages": [
                     {"text": "Ошибка при обработке метаданных. Попробуйте снова.", "request_indices": []}
@@ -16,7 +16,7 @@ _LOAN_RE = re.compile(
 
 async def validate_entities(entities: Dict, api_client: ApiClient, intent: str) -> List[str]:
     """Return list of missing / invalid required fields."""
-    agent_logger.info(f"[PARSE] Validating entities for intent: {intent}")
+    agent_logger.info("[PARSE] Validating entities for intent: {}", intent)
     missing: List[str] = []
 
     if intent == "add_income":
@@ -89,12 +89,12 @@ async def validate_entities(entities: Dict, api_client: ApiClient, intent: str)
         if not entities.get("wallet"):
             missing.append("wallet")
 
-    agent_logger.debug(f"[PARSE] Missing fields: {missing}")
+    agent_logger.debug("[PARSE] Missing fields: {}", missing)
     return missing
 
 
 async def parse_agent(state: AgentState) -> AgentState:
-    async with ApiClient(base_url=BACKEND_URL) as api_client:
+    async with ApiClient.instance(BACKEND_URL) as api_client:
         agent_logger.info("[PARSE] Entering parse_agent")
 
         # Если был выбор из клавиатуры
@@ -124,10 +124,10 @@ async def parse_agent(state: AgentState) -> AgentState:
         # Загрузка метаданных
         if not state.metadata:
             try:
-                state.metadata = await api_client.get_metadata()
+                state.metadata = await api_client.get_metadata_cached()
                 agent_logger.info("[PARSE] Metadata loaded successfully")
             except Exception as e:
-                agent_logger.error(f"[PARSE] Failed to load metadata: {e}")
+                agent_logger.error("[PARSE] Failed to load metadata: {}", e)
                 state.output = {
                     "messages": [
                         {
@@ -155,10 +155,11 @@ async def parse_agent(state: AgentState) -> AgentState:
                     response_format={"type": "json_object"},
                 )
                 choice = resp.choices[0].message
-                agent_logger.info(f"[PARSE] LLM answered for part {part_idx}")
-                agent_logger.debug(
-                    f"[PARSE] Raw LLM part {part_idx}: "
-                    f"{json.dumps(json.loads(choice.model_dump_json()), indent=2, ensure_ascii=False)}"
+                agent_logger.info("[PARSE] LLM answered for part {}", part_idx)
+                agent_logger.opt(lazy=True).debug(
+                    "[PARSE] Raw LLM part {}: {}",
+                    lambda: part_idx,
+                    lambda: json.dumps(choice.model_dump(mode="json"), indent=2, ensure_ascii=False),
                 )
 
                 parsed = json.loads(choice.content)
@@ -171,7 +172,7 @@ async def parse_agent(state: AgentState) -> AgentState:
                             entities = json.loads(entities)
                             agent_logger.info("[PARSE] Deserialized entities from string to dict")
                         except json.JSONDecodeError:
-                            agent_logger.error(f"[PARSE] Failed to deserialize entities: {entities}")
+                            agent_logger.error("[PARSE] Failed to deserialize entities: {}", entities)
                             continue
 
                     # INTENT FIX-UP
@@ -179,7 +180,7 @@ async def parse_agent(state: AgentState) -> AgentState:
                             entities.get("creditor") or _LOAN_RE.search(part_text)
                     ):
                         agent_logger.debug(
-                            f"[PARSE] Auto-switch EXPENSE → BORROW for part {part_idx}"
+                            "[PARSE] Auto-switch EXPENSE → BORROW for part {}", part_idx
                         )
                         intent = "borrow"
                         entities["wallet"] = "borrow"
@@ -224,7 +225,7 @@ async def parse_agent(state: AgentState) -> AgentState:
                     )
 
             except Exception as e:
-                agent_logger.exception(f"[PARSE] LLM error on part {part_idx}: {e}")
+                agent_logger.exception("[PARSE] LLM error on part {}: {}", part_idx, e)
                 continue
 
         # Автоматическое сопоставление категорий для доходов
@@ -240,13 +241,15 @@ async def parse_agent(state: AgentState) -> AgentState:
                     req["entities"]["category_code"] = matching_categories[0].code
                     req["missing"] = [m for m in req["missing"] if m != "category_code"]
                     agent_logger.debug(
-                        f"[PARSE] Automatically set category_code={matching_categories[0].code} "
-                        f"for comment={comment}"
+                        "[PARSE] Automatically set category_code={} "
+                        "for comment={}",
+                        matching_categories[0].code, comment
                     )
                 elif len(matching_categories) > 1:
                     agent_logger.debug(
-                        f"[PARSE] Multiple matching categories for comment={comment}: "
-                        f"{[c.name for c in matching_categories]}"
+                        "[PARSE] Multiple matching categories for comment={}: "
+                        "{}",
+                        comment, [c.name for c in matching_categories]
                     )
 
         # Лог
@@ -256,9 +259,10 @@ async def parse_agent(state: AgentState) -> AgentState:
                 "content": json.dumps(state.requests, ensure_ascii=False),
             }
         )
-        agent_logger.info(
-            f"[PARSE] Parsed {len(state.requests)} requests total:\n"
-            f"{json.dumps(state.requests, indent=2, ensure_ascii=False)}"
+        agent_logger.opt(lazy=True).info(
+            "[PARSE] Parsed {} requests total:\n{}",
+            lambda: len(state.requests),
+            lambda: json.dumps(state.requests, indent=2, ensure_ascii=False),
         )
 
         if not state.requests:
@@ -4,12 +4,13 @@ from typing import Dict, List
 from agent.agents.serialization import fetch_keyboard_items
 from agent.utils import AgentState, agent_logger
 from api_client import ApiClient
+from config import BACKEND_URL
 
 
 async def response_agent(state: AgentState) -> AgentState:
     agent_logger.info("[RESPONSE] Entering response_agent")
 
-    async with ApiClient(base_url=state.metadata.get("backend_url", "http://localhost:8000")) as api_client:
+    async with ApiClient.instance(BACKEND_URL) as api_client:
         messages: List[Dict] = state.output.get("messages", [])  # Сохраняем существующие messages
         output: List[Dict] = state.output.get("output", [])
 
@@ -24,7 +25,7 @@ async def response_agent(state: AgentState) -> AgentState:
 
             if intent == "get_analytics":
                 # Для аналитики сохраняем messages без добавления output
-                agent_logger.debug(f"[RESPONSE] Preserving messages for get_analytics: {messages}")
+                agent_logger.debug("[RESPONSE] Preserving messages for get_analytics: {}", messages)
                 continue
 
             if action["needs_clarification"]:
@@ -66,8 +67,8 @@ async def response_agent(state: AgentState) -> AgentState:
         }
 
         agent_logger.info("[RESPONSE] Response generated")
-        agent_logger.debug(
-            f"[RESPONSE] Response generated: {json.dumps(state.output, indent=2, ensure_ascii=False)}"
+        agent_logger.opt(lazy=True).debug(
+            "[RESPONSE] Response generated: {}", lambda: json.dumps(state.output, indent=2, ensure_ascii=False)
         )
 
     return state
@@ -22,7 +22,7 @@ async def fetch_keyboard_items(
         metadata: Dict[str, Any],
 ) -> List[Dict[str, str]]:
     """Создаёт элементы клавиатуры для указанного поля."""
-    logger.info(f"[SERIALIZE] fetch_keyboard_items → field={field}, req#{request_index}")
+    logger.info("[SERIALIZE] fetch_keyboard_items → field={}, req#{}", field, request_index)
 
     items = []
     intent = request.get("intent", "")
@@ -39,7 +39,7 @@ async def fetch_keyboard_items(
         elif field == "category_code":
             if intent == "add_income":
                 categories = await api_client.get_incomes()
-                logger.debug(f"[SERIALIZE] Income categories fetched: {[c.name for c in categories]}")
+                logger.debug("[SERIALIZE] Income categories fetched: {}", [c.name for c in categories])
                 items = [
                     {"text": c.name, "callback_data": f"CS:category_code={c.code}:{request_index}"}
                     for c in categories
@@ -71,10 +71,10 @@ async def fetch_keyboard_items(
             ]
 
     except Exception as e:
-        logger.error(f"[SERIALIZE] Error fetching keyboard items for {field}: {e}")
+        logger.error("[SERIALIZE] Error fetching keyboard items for {}: {}", field, e)
 
     if not items:
-        logger.warning(f"[SERIALIZE] No keyboard items fetched for {field}, req#{request_index}")
+        logger.warning("[SERIALIZE] No keyboard items fetched for {}, req#{}", field, request_index)
         items = [
             {"text": f"Не удалось загрузить {field}. Попробуйте позже.", "callback_data": f"cancel:{request_index}"}
         ]
@@ -93,7 +93,7 @@ async def serialize_messages(
     • Дорисовывает клавиатуры для уточнений
     • Добавляет confirm-сообщения для операций вида `*:confirm`
     """
-    logger.info(f"[SERIALIZE] входных сообщений: {len(messages)}")
+    logger.info("[SERIALIZE] входных сообщений: {}", len(messages))
     serialized: list[Dict] = []
 
     output_map = {o["request_index"]: o for o in output or []}
@@ -130,7 +130,7 @@ async def serialize_messages(
                             )
                             text = re.sub(r"API:fetch:\w+:\d+", "", text).strip()
                         else:
-                            logger.error(f"[SERIALIZE] Empty keyboard for API:fetch:{field}:{idx}")
+                            logger.error("[SERIALIZE] Empty keyboard for API:fetch:{}:{}", field, idx)
 
         # Обрабатываем API-запросы в тексте
         for req_idx in request_indices:
@@ -146,7 +146,7 @@ async def serialize_messages(
                         )
                         text = text.replace(api_match.group(0), "")
                     else:
-                        logger.error(f"[SERIALIZE] Empty keyboard for API:fetch:{field}:{idx}")
+                        logger.error("[SERIALIZE] Empty keyboard for API:fetch:{}:{}", field, idx)
 
             serialized.append({
                 "text": text.strip(),
@@ -158,7 +158,7 @@ async def serialize_messages(
         for req_idx in request_indices:
             if req_idx in output_map and output_map[req_idx].get("state", "").lower().endswith(":confirm"):
                 request = requests.get(req_idx, {})
-                logger.debug(f"[SERIALIZE] добавлен confirm для req#{req_idx}")
+                logger.debug("[SERIALIZE] добавлен confirm для req#{}", req_idx)
                 serialized.append({
                     "text": (
                                 await format_operation_message(request["entities"], api_client)
@@ -174,7 +174,7 @@ async def serialize_messages(
                     "request_indices": [req_idx],
                 })
 
-    logger.info(f"[SERIALIZE] итоговых сообщений: {len(serialized)}")
+    logger.info("[SERIALIZE] итоговых сообщений: {}", len(serialized))
     return serialized
 
 
@@ -192,7 +192,7 @@ def deserialize_callback_data(callback_data: str, state: Dict) -> Dict:
     """
     Обновляет состояние на основе callback-данных.
     """
-    logger, logger.info(f"[SERIALIZE] deserialize: {callback_data}")
+    logger.info("[SERIALIZE] deserialize: {}", callback_data)
     state = state.copy()
     requests = state.get("requests", [])
 
@@ -207,7 +207,7 @@ def deserialize_callback_data(callback_data: str, state: Dict) -> Dict:
                     req["missing"] = [m for m in req["missing"] if m != field]
                     break
         except Exception as e:
-            logger.error(f"[SERIALIZE] bad callback_data: {callback_data}, error: {e}")
+            logger.error("[SERIALIZE] bad callback_data: {}, error: {}", callback_data, e)
             return state
 
         # Каскадное ожидание следующих полей
@@ -227,6 +227,6 @@ def deserialize_callback_data(callback_data: str, state: Dict) -> Dict:
             state["requests"] = [r for r in requests if r["index"] != req_idx]
             state["messages"].append({"role": "user", "content": f"Cancelled request {req_idx}"})
         except Exception as e:
-            logger.error(f"[SERIALIZE] bad cancel callback_data: {callback_data}, error: {e}")
+            logger.error("[SERIALIZE] bad cancel callback_data: {}, error: {}", callback_data, e)
 
     return state
@@ -33,7 +33,7 @@ async def split_agent(state: AgentState) -> AgentState:
             response_format={"type": "json_object"},
         )
         choice = resp.choices[0].message
-        agent_logger.debug(f"[SPLIT] Raw LLM answer:\n{choice.content}")
+        agent_logger.debug("[SPLIT] Raw LLM answer:\n{}", choice.content)
 
         data = json.loads(choice.content)
         parts: List[str] = [p.strip() for p in data.get("parts", []) if p.strip()]
@@ -46,10 +46,10 @@ async def split_agent(state: AgentState) -> AgentState:
         state.messages.append(
             {"role": "assistant", "content": f"Split into {len(parts)} part(s)"}
         )
-        agent_logger.info(f"[SPLIT] Done → {len(parts)} parts")
+        agent_logger.info("[SPLIT] Done → {} parts", len(parts))
 
     except Exception as e:
-        agent_logger.exception(f"[SPLIT] Failed: {e}")
+        agent_logger.exception("[SPLIT] Failed: {}", e)
         # fallback — оставляем исходный текст одной частью
         state.parts = [user_text]
 
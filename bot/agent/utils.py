@@ -1,4 +1,3 @@
-import logging
 from typing import Dict, List, Any, Optional, Tuple
 
 from loguru import logger
@@ -8,7 +7,7 @@ from thefuzz import process
 from typing_extensions import TypedDict
 
 from api_client import CodeName
-from config import OPENAI_API_KEY
+from config import OPENAI_API_KEY, LOG_LEVEL
 
 # Cache for API responses
 section_cache: List[CodeName] = []
@@ -17,32 +16,33 @@ subcategory_cache: Dict[str, List[CodeName]] = {}
 creditor_cache: List[CodeName] = []
 
 # Initialize OpenAI client
-logger.debug(f"Initializing OpenAI client with API key: {'*' * len(OPENAI_API_KEY[:-4]) + OPENAI_API_KEY[-4:]}")
+logger.debug("Initializing OpenAI client with API key: {}", '*' * len(OPENAI_API_KEY[:-4]) + OPENAI_API_KEY[-4:])
 try:
     openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
 except Exception as e:
-    logger.error(f"Failed to initialize OpenAI client: {e}")
+    logger.error("Failed to initialize OpenAI client: {}", e)
     raise
 
 # Logging setup
-class NoMetadataFilter(logging.Filter):
-    def filter(self, record):
-        return not ("[METADATA] Fetched metadata" in record.getMessage())
+def skip_metadata_records(record) -> bool:
+    """Loguru sink filter: keeps "[METADATA] Fetched metadata" records out of the agent sinks."""
+    return "[METADATA] Fetched metadata" not in record["message"]
 
 def setup_logging():
-    """Configure centralized logging with loguru."""
+    """Configure centralized logging with loguru: the only place sinks are added, at LOG_LEVEL."""
     logger.remove()  # Remove default handler
     logger.add(
         sink="logs/agent.log",
-        level="DEBUG",
+        level=LOG_LEVEL,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name} | {message}",
         rotation="10 MB",
-        filter=lambda record: not ("[METADATA] Fetched metadata" in record["message"])
+        filter=skip_metadata_records
     )
     logger.add(
         sink=lambda msg: print(msg, end=""),
-        level="DEBUG",
+        level=LOG_LEVEL,
         colorize=True,
+        filter=skip_metadata_records,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level}</level> | <cyan>{name}</cyan> | <level>{message}</level>"
     )
     return logger
@@ -78,12 +78,12 @@ class AgentState(BaseModel):
 def fuzzy_match(query: str, choices: list) -> Tuple[Optional[str], float]:
     """Perform fuzzy matching of query against choices."""
     if not choices:
-        agent_logger.warning(f"[FUZZY] No choices provided for query: {query}")
+        agent_logger.warning("[FUZZY] No choices provided for query: {}", query)
         return None, 0.0
     result = process.extractOne(query, choices)
     if result is None:
-        agent_logger.warning(f"[FUZZY] No fuzzy match found for query: {query}")
+        agent_logger.warning("[FUZZY] No fuzzy match found for query: {}", query)
         return None, 0.0
     match, score = result[0], result[1] / 100.0
-    agent_logger.debug(f"[FUZZY] Fuzzy match: query={query}, match={match}, score={score}")
+    agent_logger.debug("[FUZZY] Fuzzy match: query={}, match={}, score={}", query, match, score)
     return match, score
\ No newline at end of file
@@ -1,6 +1,8 @@
 # bot/api_client.py
+import asyncio
 import os
-from typing import List, Dict, Any, Literal, Optional, Tuple
+import time
+from typing import List, Dict, Any, Literal, Optional, Tuple, ClassVar
 
 import aiohttp
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
@@ -8,7 +10,10 @@ from aiogram.utils.keyboard import InlineKeyboardBuilder
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 
-from config import BACKEND_URL
+from config import BACKEND_URL, REFERENCE_CACHE_TTL
+from utils.logging import configure_logger
+
+logger = configure_logger("[API_CLIENT]", "blue")
 
 # Проверка BACKEND_URL
 if not BACKEND_URL:
@@ -54,16 +59,70 @@ class CreditorIn(BaseModel):
         populate_by_name = True
 
 class ApiClient:
+    # Метаданные общие для всех экземпляров с одним base_url:
+    # base_url -> (момент истечения, метаданные)
+    _metadata_cache: ClassVar[Dict[str, Tuple[float, Dict[str, Any]]]] = {}
+    _metadata_locks: ClassVar[Dict[str, asyncio.Lock]] = {}
+    _metadata_refreshing: ClassVar[Dict[str, asyncio.Task]] = {}
+    # Общие клиенты процесса: base_url -> ApiClient (см. instance())
+    _instances: ClassVar[Dict[str, "ApiClient"]] = {}
+
     def __init__(self, base_url: str = BACKEND_URL):
         self.base_url = base_url
         self.session: Optional[aiohttp.ClientSession] = None
-
-
+        self._shared = False
+        # Кэш справочников: ключ -> (момент истечения по time.monotonic(), значение)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+
+    def _cache_get(self, key: str) -> Any:
+        """Значение из кэша справочников или None, если его нет или срок истёк."""
+        entry = self._cache.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def _cache_set(self, key: str, value: Any) -> None:
+        """Кладёт значение в кэш справочников на REFERENCE_CACHE_TTL секунд."""
+        self._cache[key] = (time.monotonic() + REFERENCE_CACHE_TTL, value)
+
+    def invalidate_cache(self) -> None:
+        """Сбрасывает кэш справочников и метаданных (например, после refresh_data)."""
+        self._cache.clear()
+        self._metadata_cache.pop(self.base_url, None)
+
+    @classmethod
+    def instance(cls, base_url: str = BACKEND_URL) -> "ApiClient":
+        """
+        Общий на процесс клиент для base_url: одна сессия и пул keep-alive соединений.
+        `async with ApiClient.instance(...)` не закрывает сессию — это делает close() при остановке бота.
+        """
+        client = cls._instances.get(base_url)
+        if client is None:
+            client = cls._instances[base_url] = cls(base_url=base_url)
+            client._shared = True
+        return client
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Закрывает сессии всех общих клиентов (вызывается при остановке бота)."""
+        await asyncio.gather(*(client.close() for client in cls._instances.values()))
+
+    async def warm_up(self) -> None:
+        """Параллельно заполняет кэши справочников и метаданных (вызывается при старте бота)."""
+        results = await asyncio.gather(
+            self.get_income_category_map(),
+            self.get_metadata_cached(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
 
     async def _ensure_session(self):
         """Ленивая инициализация aiohttp.ClientSession."""
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(limit=100, keepalive_timeout=60, enable_cleanup_closed=True)
+            self.session = aiohttp.ClientSession(connector=connector)
 
     async def __aenter__(self):
         """Вход в асинхронный контекстный менеджер."""
@@ -71,8 +130,9 @@ class ApiClient:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Выход из асинхронного контекстного менеджера."""
-        await self.close()
+        """Выход из асинхронного контекстного менеджера (общий клиент остаётся открытым)."""
+        if not self._shared:
+            await self.close()
 
     async def close(self):
         """Закрытие сессии aiohttp."""
@@ -127,46 +187,114 @@ class ApiClient:
 
     async def refresh_data(self) -> Dict[str, str]:
         """Обновление кэша и данных из Google Sheets."""
-        return await self._make_request("POST", "/v1/service/refresh")
+        result = await self._make_request("POST", "/v1/service/refresh")
+        # Сбрасываем кэши только после успешного обновления: иначе параллельный запрос
+        # успел бы снова закэшировать старые данные
+        if "detail" not in result:
+            self.invalidate_cache()
+        return result
 
     async def get_metadata(self) -> Dict[str, Any]:
         """Получение полной структуры метаданных из Google Sheets."""
         return await self._make_request("GET", "/v1/service/meta")
 
+    async def get_metadata_cached(self, ttl: float = REFERENCE_CACHE_TTL) -> Dict[str, Any]:
+        """
+        Метаданные с refresh-ahead кэшем, общим для всех клиентов одного base_url.
+        После половины ttl отдаётся кэш, а обновление запускается в фоне;
+        после истечения ttl вызывающие ждут одного общего запроса.
+        """
+        now = time.monotonic()
+        entry = self._metadata_cache.get(self.base_url)
+        if entry and entry[0] > now:
+            if entry[0] - now < ttl / 2 and self.base_url not in self._metadata_refreshing:
+                task = asyncio.create_task(self._refresh_metadata(ttl))
+                self._metadata_refreshing[self.base_url] = task
+                task.add_done_callback(lambda _: self._metadata_refreshing.pop(self.base_url, None))
+            return entry[1]
+
+        lock = self._metadata_locks.setdefault(self.base_url, asyncio.Lock())
+        async with lock:
+            entry = self._metadata_cache.get(self.base_url)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+            metadata = await self.get_metadata()
+            if metadata and "detail" not in metadata:  # ошибки шлюза не кэшируем
+                self._metadata_cache[self.base_url] = (time.monotonic() + ttl, metadata)
+            return metadata
+
+    async def _refresh_metadata(self, ttl: float) -> None:
+        """Фоновое обновление метаданных через общий клиент: исходный может быть уже закрыт."""
+        try:
+            metadata = await ApiClient.instance(self.base_url).get_metadata()
+        except Exception:
+            # Задачу никто не ждёт: без лога ошибка (таймаут, не-JSON ответ) потерялась бы
+            logger.exception("Фоновое обновление метаданных {} не удалось", self.base_url)
+            return
+        if metadata and "detail" not in metadata:
+            self._metadata_cache[self.base_url] = (time.monotonic() + ttl, metadata)
+
+    async def _get_code_names(self, endpoint: str) -> List[CodeName]:
+        """Справочник [{code, name}] по endpoint; кэшируется на REFERENCE_CACHE_TTL (ошибки — нет)."""
+        items = self._cache_get(endpoint)
+        if items is None:
+            data = await self._make_request("GET", endpoint)
+            if "detail" in data:
+                return []
+            items = [CodeName(**item) for item in data]
+            if items:
+                self._cache_set(endpoint, items)
+        return items
+
     async def get_incomes(self) -> List[CodeName]:
         """Получение списка категорий доходов."""
-        data = await self._make_request("GET", "/v1/keyboard/incomes")
-        if "detail" in data:
-            return []
-        return [CodeName(**item) for item in data]
+        return await self._get_code_names("/v1/keyboard/incomes")
+
+    async def _get_name_map(self, endpoint: str) -> Dict[str, str]:
+        """Словарь {код: название} справочника; строится один раз на время жизни кэша списка."""
+        key = f"names:{endpoint}"
+        mapping = self._cache_get(key)
+        if mapping is None:
+            mapping = {item.code: item.name for item in await self._get_code_names(endpoint)}
+            if mapping:  # пустой ответ (ошибка шлюза) не кэшируем
+                self._cache_set(key, mapping)
+        return mapping
+
+    async def get_income_category_map(self) -> Dict[str, str]:
+        """Словарь {код: название} категорий доходов; кэшируется на REFERENCE_CACHE_TTL."""
+        return await self._get_name_map("/v1/keyboard/incomes")
 
     async def get_sections(self) -> List[CodeName]:
         """Получение списка секций расходов."""
-        data = await self._make_request("GET", "/v1/keyboard/sections")
-        if "detail" in data:
-            return []
-        return [CodeName(**item) for item in data]
+        return await self._get_code_names("/v1/keyboard/sections")
 
     async def get_categories(self, sec_code: str) -> List[CodeName]:
         """Получение списка категорий для заданной секции."""
-        data = await self._make_request("GET", f"/v1/keyboard/categories/{sec_code}")
-        if "detail" in data:
-            return []
-        return [CodeName(**item) for item in data]
+        return await self._get_code_names(f"/v1/keyboard/categories/{sec_code}")
 
     async def get_subcategories(self, sec_code: str, cat_code: str) -> List[CodeName]:
         """Получение списка подкатегорий для заданной секции и категории."""
-        data = await self._make_request("GET", f"/v1/keyboard/subcategories/{sec_code}/{cat_code}")
-        if "detail" in data:
-            return []
-        return [CodeName(**item) for item in data]
+        return await self._get_code_names(f"/v1/keyboard/subcategories/{sec_code}/{cat_code}")
 
     async def get_creditors(self) -> List[CodeName]:
         """Получение списка кредиторов."""
-        data = await self._make_request("GET", "/v1/keyboard/creditors")
-        if "detail" in data:
-            return []
-        return [CodeName(**item) for item in data]
+        return await self._get_code_names("/v1/keyboard/creditors")
+
+    async def get_section_map(self) -> Dict[str, str]:
+        """Словарь {код: название} секций расходов."""
+        return await self._get_name_map("/v1/keyboard/sections")
+
+    async def get_category_map(self, sec_code: str) -> Dict[str, str]:
+        """Словарь {код: название} категорий секции."""
+        return await self._get_name_map(f"/v1/keyboard/categories/{sec_code}")
+
+    async def get_subcategory_map(self, sec_code: str, cat_code: str) -> Dict[str, str]:
+        """Словарь {код: название} подкатегорий категории."""
+        return await self._get_name_map(f"/v1/keyboard/subcategories/{sec_code}/{cat_code}")
+
+    async def get_creditor_map(self) -> Dict[str, str]:
+        """Словарь {код: название} кредиторов."""
+        return await self._get_name_map("/v1/keyboard/creditors")
 
     async def day_breakdown(
             self,
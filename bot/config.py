@@ -17,6 +17,17 @@ PATH_TO_AUDIO = os.getenv("PATH_TO_AUDIO")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")  # если нужна интеграция с OpenAI
 REDIS_URL = os.getenv("REDIS_URL")
 USE_REDIS = os.getenv("USE_REDIS", "true").lower() == "true"
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()  # DEBUG для разработки
+
+# --- Опрос фоновых задач шлюза -----------------------------------------------
+TASK_POLL_INTERVAL = float(os.getenv("TASK_POLL_INTERVAL", "0.5"))  # первая пауза между запросами статуса
+TASK_POLL_MAX_INTERVAL = float(os.getenv("TASK_POLL_MAX_INTERVAL", "4"))  # потолок паузы при backoff
+TASK_POLL_BACKOFF = float(os.getenv("TASK_POLL_BACKOFF", "1.5"))  # множитель паузы после каждого опроса
+TASK_POLL_TIMEOUT = float(os.getenv("TASK_POLL_TIMEOUT", "20"))  # общий бюджет ожидания, секунды
+TASK_POLL_MAX_ATTEMPTS = int(os.getenv("TASK_POLL_MAX_ATTEMPTS", "40"))
+
+# --- Кэш справочников шлюза --------------------------------------------------
+REFERENCE_CACHE_TTL = float(os.getenv("REFERENCE_CACHE_TTL", "300"))  # секунды жизни кэша категорий
 
 # --- Базовые проверки --------------------------------------------------------
 _missing = [
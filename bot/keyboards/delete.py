@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardMarkup
 
 from .utils import (
@@ -14,7 +16,12 @@ def create_delete_operation_kb(task_ids: list[str], confirm: bool = False) -> In
     Создаёт инлайн-клавиатуру для удаления операции по списку task_ids.
     Если confirm=True, показывает кнопки 'Удалить' и 'Отмена'.
     """
-    task_ids_str = ",".join(task_ids) if task_ids else "noop"
+    return _build_delete_operation_kb(",".join(task_ids) if task_ids else "noop", confirm)
+
+
+@lru_cache(maxsize=256)
+def _build_delete_operation_kb(task_ids_str: str, confirm: bool) -> InlineKeyboardMarkup:
+    # Клавиатура зависит только от набора задач, поэтому готовая разметка переиспользуется
     if not confirm:
         items = [(
             "Удалить 🗑️",
@@ -43,7 +50,11 @@ def create_delete_coming_kb(task_ids: list[str], confirm: bool = False) -> Inlin
     Создаёт инлайн-клавиатуру для удаления входящей операции по списку task_ids.
     Если confirm=True, показывает кнопки 'Удалить' и 'Отмена'.
     """
-    task_ids_str = ",".join(task_ids) if task_ids else "noop"
+    return _build_delete_coming_kb(",".join(task_ids) if task_ids else "noop", confirm)
+
+
+@lru_cache(maxsize=256)
+def _build_delete_coming_kb(task_ids_str: str, confirm: bool) -> InlineKeyboardMarkup:
     if not confirm:
         items = [(
             "Удалить 🗑️",
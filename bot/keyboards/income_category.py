@@ -1,17 +1,29 @@
 from aiogram.filters.callback_data import CallbackData
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
-from api_client import ApiClient
+from api_client import ApiClient, CodeName
 
 class ChooseIncomeCategoryCallback(CallbackData, prefix="income_cat"):
     category_code: str
     back: bool = False
 
+# Готовые клавиатуры по base_url шлюза: base_url -> (список категорий, клавиатура).
+# Список берётся из кэша справочников ApiClient: пока он тот же объект, клавиатура актуальна;
+# после истечения TTL или invalidate_cache() приходит новый список и клавиатура собирается заново
+_keyboard_cache: dict[str, tuple[list[CodeName], InlineKeyboardMarkup]] = {}
+
 async def create_income_category_keyboard(api_client: ApiClient) -> InlineKeyboardMarkup:
     categories = await api_client.get_incomes()
+    cached = _keyboard_cache.get(api_client.base_url)
+    if cached and cached[0] is categories:
+        return cached[1]
+
     keyboard = []
     for category in categories:
         keyboard.append([InlineKeyboardButton(
             text=category.name,
             callback_data=ChooseIncomeCategoryCallback(category_code=category.code).pack()
         )])
-    return InlineKeyboardMarkup(inline_keyboard=keyboard)
\ No newline at end of file
+    markup = InlineKeyboardMarkup(inline_keyboard=keyboard)
+    if keyboard:  # пустой список (ошибка шлюза) не кэшируем
+        _keyboard_cache[api_client.base_url] = (categories, markup)
+    return markup
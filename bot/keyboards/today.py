@@ -1,14 +1,20 @@
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 from .utils import TodayCallback
 from datetime import timedelta
 
-def create_today_keyboard() -> InlineKeyboardMarkup:
+@lru_cache(maxsize=2)
+def _build_today_keyboard(day: date) -> InlineKeyboardMarkup:
+    # Кнопки меняются раз в сутки, поэтому клавиатура кэшируется по дате
     builder = InlineKeyboardBuilder()
-    today = datetime.now().strftime("%d.%m.%Y")
-    yesterday = (datetime.now() - timedelta(days=1)).strftime("%d.%m.%Y")
+    today = day.strftime("%d.%m.%Y")
+    yesterday = (day - timedelta(days=1)).strftime("%d.%m.%Y")
     builder.add(InlineKeyboardButton(text="Сегодня", callback_data=TodayCallback(today=today).pack()))
     builder.add(InlineKeyboardButton(text="Вчера", callback_data=TodayCallback(today=yesterday).pack()))
     builder.adjust(1)
-    return builder.as_markup()
\ No newline at end of file
+    return builder.as_markup()
+
+def create_today_keyboard() -> InlineKeyboardMarkup:
+    return _build_today_keyboard(date.today())
@@ -9,6 +9,7 @@ from aiogram.fsm.storage.redis import RedisStorage
 
 from api_client import ApiClient
 from comands import set_bot_commands
+from keyboards.income_category import create_income_category_keyboard
 from middleware.dependency_injection import DependencyInjectionMiddleware
 from middleware.error_handling import ErrorHandlingMiddleware
 from middleware.logging import LoggingMiddleware
@@ -18,6 +19,8 @@ from routers.expenses.expenses_router import create_expenses_router
 from routers.income.income_router import create_income_router
 from routers.start_router import create_start_router
 from utils.logging import configure_logger
+from utils.message_utils import run_delete_worker
+from utils.ratelimit import RateLimitMiddleware
 
 # ← ВСЁ про переменные окружения и .env.dev.dev теперь здесь
 from config import BOT_TOKEN, BACKEND_URL, REDIS_URL, USE_REDIS
@@ -31,6 +34,8 @@ bot = Bot(
         token=BOT_TOKEN,
         default=DefaultBotProperties(parse_mode=ParseMode.HTML),
     )
+# Исходящие запросы к Bot API проходят через лимитер (30/с глобально, ~1/с на чат)
+bot.session.middleware(RateLimitMiddleware())
 
 
 async def main() -> None:
@@ -53,7 +58,7 @@ async def main() -> None:
         storage = MemoryStorage()
 
     dp = Dispatcher(storage=storage)
-    api_client = ApiClient(base_url=BACKEND_URL)
+    api_client = ApiClient.instance(BACKEND_URL)
 
     # Middlewares
     dp.update.outer_middleware(DependencyInjectionMiddleware(bot=bot, api_client=api_client))
@@ -67,13 +72,27 @@ async def main() -> None:
     dp.include_router(create_ai_router(bot, api_client))
     dp.include_router(create_delete_router(bot, api_client))
 
+    # Фоновое пакетное удаление сообщений: обработчики не ждут deleteMessages
+    delete_worker = asyncio.create_task(run_delete_worker(bot))
+
     try:
         logger.info(f"Bot @{bot_name} is starting…")
         await set_bot_commands(bot)
+        # Прогрев кэшей шлюза одним параллельным пакетом; ошибки не мешают запуску
+        warm_up = await asyncio.gather(
+            api_client.warm_up(),
+            create_income_category_keyboard(api_client),
+            return_exceptions=True,
+        )
+        for result in warm_up:
+            if isinstance(result, Exception):
+                logger.warning("Не удалось прогреть кэш шлюза: {}", result)
         await dp.start_polling(bot)
     finally:
         logger.info(f"Bot @{bot_name} is shutting down…")
-        await api_client.close()
+        delete_worker.cancel()
+        await asyncio.gather(delete_worker, return_exceptions=True)
+        await ApiClient.close_all()
         await bot.session.close()
         await storage.close()
 
@@ -0,0 +1,47 @@
+# Bot/middleware/chat_serializer.py
+import asyncio
+from typing import Dict, Any, Callable, Awaitable, Optional
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject, Message, CallbackQuery
+
+from utils.logging import configure_logger
+from utils.message_utils import chat_lock
+
+logger = configure_logger("[CHAT_SERIALIZER]", "yellow")
+
+
+class PerChatSerializerMiddleware(BaseMiddleware):
+    """
+    Обрабатывает апдейты одного чата строго по очереди, разные чаты — параллельно.
+    Очередь внутри чата — FIFO-замок chat_lock(); общий семафор ограничивает
+    число одновременно выполняемых обработчиков.
+    """
+
+    def __init__(self, max_concurrency: int = 256):
+        super().__init__()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    @staticmethod
+    def _chat_id(event: TelegramObject) -> Optional[int]:
+        if isinstance(event, Message):
+            return event.chat.id
+        if isinstance(event, CallbackQuery):
+            return event.message.chat.id if event.message else event.from_user.id
+        return None
+
+    async def __call__(
+            self,
+            handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+            event: TelegramObject,
+            data: Dict[str, Any]
+    ) -> Any:
+        chat_id = self._chat_id(event)
+        if chat_id is None:
+            return await handler(event, data)
+
+        lock = chat_lock(chat_id)
+        if lock.locked():
+            logger.debug("Апдейт чата {} ждёт завершения предыдущего", chat_id)
+        async with lock, self._semaphore:
+            return await handler(event, data)
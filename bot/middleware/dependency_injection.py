@@ -30,5 +30,5 @@ class DependencyInjectionMiddleware(BaseMiddleware):
             # logger.debug("Handler completed in DependencyInjectionMiddleware")
             return result
         except Exception as e:
-            logger.error(f"Handler failed in DependencyInjectionMiddleware: {e}")
+            logger.error("Handler failed in DependencyInjectionMiddleware: {}", e)
             raise
@@ -10,7 +10,7 @@ class ErrorHandlingMiddleware(BaseMiddleware):
         try:
             return await handler(event, data)
         except Exception as e:
-            logger.error(f"[MIDDLEWARE] Error: {e}")
+            logger.error("[MIDDLEWARE] Error: {}", e)
             if isinstance(event, CallbackQuery):
                 await event.answer("Произошла ошибка, попробуйте снова")
             raise
\ No newline at end of file
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import json
 from typing import Optional, Dict, Any
 
@@ -12,7 +11,7 @@ from agent.agent import Agent
 from agent.agents.serialization import serialize_messages, create_aiogram_keyboard
 from api_client import ApiClient
 from utils.logging import configure_logger
-from utils.message_utils import cancel_expired_message
+from utils.message_utils import schedule_message_expiry
 
 logger = configure_logger("[AGENT_PROCESSOR]", "cyan")
 
@@ -47,21 +46,25 @@ async def process_agent_request(
         interactive: bool = True,
         prev_state: Dict | None = None,
         selection: str | None = None,
+        api_client: ApiClient | None = None,
 ) -> Dict:
     """
     Обёртка над `agent.process_request`, всегда выдаёт dict.
+    `api_client` пробрасывается в агент, чтобы он не открывал своё соединение.
     """
-    logger.debug(f"[AGENT_PROCESSOR] Processing request: input={input_text[:50]}, interactive={interactive}")
+    logger.debug("[AGENT_PROCESSOR] Processing request: input={}, interactive={}", input_text[:50], interactive)
     raw_result = await agent.process_request(
         input_text,
         interactive=interactive,
         prev_state=prev_state,
         selection=selection,
+        api_client=api_client,
     )
     result: Dict[str, Any] = _normalize_result(raw_result)
     logger.debug(
-        f"[AGENT_PROCESSOR] Result: messages={len(result.get('messages', []))}, "
-        f"output={len(result.get('output', []))}"
+        "[AGENT_PROCESSOR] Result: messages={}, "
+        "output={}",
+        len(result.get('messages', [])), len(result.get('output', []))
     )
     return result
 
@@ -78,8 +81,10 @@ async def handle_agent_result(
     """
     Универсальный вывод результатов агента в чат.
     """
-    logger.info(f"[AGENT_PROCESSOR] Handling result for chat={chat_id}, input={input_text[:50]}")
-    logger.debug(f"[AGENT_PROCESSOR] Result content: {json.dumps(result, ensure_ascii=False, indent=2)}")
+    logger.info("[AGENT_PROCESSOR] Handling result for chat={}, input={}", chat_id, input_text[:50])
+    logger.opt(lazy=True).debug(
+        "[AGENT_PROCESSOR] Result content: {}", lambda: json.dumps(result, ensure_ascii=False, indent=2)
+    )
 
     serialized = await serialize_messages(
         result.get("messages", []),
@@ -93,8 +98,6 @@ async def handle_agent_result(
 
     sent: Message | None = None
     current_msg_id = message_id
-    data = await state.get_data()
-    timer_tasks = data.get("timer_tasks", [])
 
     for item in serialized:
         text = item.get("text") or "😓 Пустое сообщение"
@@ -119,7 +122,7 @@ async def handle_agent_result(
                     parse_mode="HTML",
                 )
             except Exception as e:
-                logger.warning(f"[AGENT_PROCESSOR] Edit {current_msg_id} failed: {e}")
+                logger.warning("[AGENT_PROCESSOR] Edit {} failed: {}", current_msg_id, e)
                 sent = await bot.send_message(chat_id=chat_id, text=text, reply_markup=kb, parse_mode="HTML")
             current_msg_id = None
         else:
@@ -127,10 +130,6 @@ async def handle_agent_result(
 
         # таймер для сообщений с клавиатурой
         if sent and kb:
-            timer_task = asyncio.create_task(
-                cancel_expired_message(bot, chat_id, sent.message_id, state, timeout=30)
-            )
-            timer_tasks.append({"message_id": sent.message_id, "task": timer_task})
-            await state.update_data(timer_tasks=timer_tasks)
+            schedule_message_expiry(bot, chat_id, sent.message_id, state, timeout=30)
 
     return sent
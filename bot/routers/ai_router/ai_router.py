@@ -10,7 +10,7 @@ from routers.ai_router.callback_handler import create_callback_router
 from routers.ai_router.message_handler import create_message_router
 from routers.ai_router.states import MessageState
 from utils.logging import configure_logger
-from utils.message_utils import track_messages, delete_message, delete_key_messages, delete_tracked_messages
+from utils.message_utils import track_messages, delete_message, delete_all_messages, cancel_message_expiry
 
 logger = configure_logger("[AI_ROUTER]", "cyan")
 
@@ -22,22 +22,22 @@ def create_ai_router(bot: Bot, api_client: ApiClient) -> Router:
     @track_messages
     async def start_ai(message: Message, state: FSMContext, bot: Bot) -> Message:
         chat_id = message.chat.id
-        logger.debug(f"[AI_ROUTER] Handling /start_ai for chat {chat_id}, current state: {await state.get_state()}")
+        logger.debug("[AI_ROUTER] Handling /start_ai for chat {}, current state: {}", chat_id, await state.get_state())
 
-        # Полная очистка состояния
+        # Полная очистка состояния и таймеров автоотмены
+        cancel_message_expiry(chat_id)
         await state.clear()
         await state.update_data(
             messages_to_delete=[],
             agent_state=None,
             input_text="",
-            timer_tasks=[],
             operation_info=""
         )
         data = await state.get_data()
-        logger.debug(f"[AI_ROUTER] State after clear: {await state.get_state()}, data: {data}")
+        logger.debug("[AI_ROUTER] State after clear: {}, data: {}", await state.get_state(), data)
 
-        await delete_tracked_messages(bot, state, chat_id)
-        await delete_key_messages(bot, state, chat_id)
+        # Удаляем временные и ключевые сообщения одним пакетом
+        await delete_all_messages(bot, state, chat_id)
         await delete_message(bot, chat_id, message.message_id)
 
         sent_message = await bot.send_message(
@@ -47,26 +47,26 @@ def create_ai_router(bot: Bot, api_client: ApiClient) -> Router:
             parse_mode=ParseMode.HTML
         )
         await state.set_state(MessageState.initial)
-        logger.info(f"[AI_ROUTER] Set state to initial for chat {chat_id}, sent message {sent_message.message_id}")
+        logger.info("[AI_ROUTER] Set state to initial for chat {}, sent message {}", chat_id, sent_message.message_id)
         return sent_message
 
     @ai_router.message(Command("cancel_ai"))
     @track_messages
     async def cancel_ai(message: Message, state: FSMContext, bot: Bot) -> Message:
         chat_id = message.chat.id
-        logger.debug(f"[AI_ROUTER] Handling /cancel_ai for chat {chat_id}, current state: {await state.get_state()}")
+        logger.debug("[AI_ROUTER] Handling /cancel_ai for chat {}, current state: {}", chat_id, await state.get_state())
 
+        cancel_message_expiry(chat_id)
         await state.clear()
         await state.update_data(
             messages_to_delete=[],
             agent_state=None,
             input_text="",
-            timer_tasks=[],
             operation_info=""
         )
         await delete_message(bot, chat_id, message.message_id)
-        await delete_tracked_messages(bot, state, chat_id)
-        await delete_key_messages(bot, state, chat_id)
+        # Удаляем временные и ключевые сообщения одним пакетом
+        await delete_all_messages(bot, state, chat_id)
 
         sent_message = await bot.send_message(
             chat_id=chat_id,
@@ -74,7 +74,7 @@ def create_ai_router(bot: Bot, api_client: ApiClient) -> Router:
             reply_markup=create_start_kb()
         )
         await state.set_state(MessageState.initial)
-        logger.info(f"[AI_ROUTER] Cancelled AI for chat {chat_id}, set state to initial")
+        logger.info("[AI_ROUTER] Cancelled AI for chat {}, set state to initial", chat_id)
         return sent_message
 
     # @ai_router.message()
@@ -26,6 +26,7 @@ from utils.message_utils import (
     format_operation_message,
     check_task_status,
     send_success_message,
+    cancel_message_expiry,
 )
 
 logger = configure_logger("[CALLBACK_HANDLER]", "magenta")
@@ -59,7 +60,7 @@ def create_callback_router(bot: Bot, api_client: ApiClient) -> Router:
             query: CallbackQuery, state: FSMContext, bot: Bot
     ) -> Optional[Message]:
         if not query.message:  # safety‑check
-            logger.warning(f"CallbackQuery без message от {query.from_user.id}")
+            logger.warning("CallbackQuery без message от {}", query.from_user.id)
             return None
 
         user_id = query.from_user.id
@@ -67,13 +68,10 @@ def create_callback_router(bot: Bot, api_client: ApiClient) -> Router:
         message_id = query.message.message_id
         selection = query.data
 
-        logger.info(f"{user_id=}: выбрал {selection=}")
+        logger.info("user_id={}: выбрал selection={!r}", user_id, selection)
 
         # отменяем таймеры
-        data = await state.get_data()
-        for t in data.get("timer_tasks", []):
-            t["task"].cancel()
-        await state.update_data(timer_tasks=[])
+        cancel_message_expiry(chat_id)
 
         # previous agent_state
         data = await state.get_data()
@@ -106,7 +104,8 @@ def create_callback_router(bot: Bot, api_client: ApiClient) -> Router:
                 parse_mode="HTML",
             )
             result = await process_agent_request(
-                agent, input_text, interactive=True, selection=selection, prev_state=prev_state
+                agent, input_text, interactive=True, selection=selection, prev_state=prev_state,
+                api_client=api_client
             )
             return await handle_agent_result(
                 result, bot, state, chat_id, input_text, api_client, message_id=processing.message_id
@@ -114,7 +113,7 @@ def create_callback_router(bot: Bot, api_client: ApiClient) -> Router:
 
         # ---------- 2.1.b Обычный выбор категории ---------- #
         if not prev_state:
-            logger.error(f"state потерян у {user_id}")
+            logger.error("state потерян у {}", user_id)
             await bot.edit_message_text(
                 chat_id=chat_id,
                 message_id=message_id,
@@ -126,7 +125,8 @@ def create_callback_router(bot: Bot, api_client: ApiClient) -> Router:
         prev_state = deserialize_callback_data(selection, prev_state)
         processing = await bot.send_message(chat_id=chat_id, text="🔍 Обрабатываем выбор…", parse_mode="HTML")
         result = await process_agent_request(
-            agent, input_text, interactive=True, selection=selection, prev_state=prev_state
+            agent, input_text, interactive=True, selection=selection, prev_state=prev_state,
+            api_client=api_client
         )
         return await handle_agent_result(
             result, bot, state, chat_id, input_text, api_client, message_id=processing.message_id
@@ -148,13 +148,11 @@ def create_callback_router(bot: Bot, api_client: ApiClient) -> Router:
         message_id = query.message.message_id
         request_index = int(query.data.split(":")[1])
 
-        logger.info(f"{user_id=}: подтвердил запрос #{request_index}")
+        logger.info("user_id={}: подтвердил запрос #{}", user_id, request_index)
 
         # отменяем таймеры
+        cancel_message_expiry(chat_id)
         data = await state.get_data()
-        for t in data.get("timer_tasks", []):
-            t["task"].cancel()
-        await state.update_data(timer_tasks=[])
 
         await state.set_state(MessageState.confirming_operation)
 
@@ -289,9 +287,7 @@ def create_callback_router(bot: Bot, api_client: ApiClient) -> Router:
                 operation_info,
             )
             # чистим таймеры для этого сообщения
-            timer_tasks = data.get("timer_tasks", [])
-            timer_tasks = [t for t in timer_tasks if t["message_id"] != message_id]
-            await state.update_data(timer_tasks=timer_tasks)
+            cancel_message_expiry(chat_id, message_id)
             return query.message
 
         except Exception as err:
@@ -29,6 +29,7 @@ from utils.message_utils import (
     delete_tracked_messages,
     animate_processing,
     format_operation_message,
+    cancel_message_expiry,
 )
 from utils.voice_messages_utils import handle_audio_message
 
@@ -76,7 +77,7 @@ def create_message_router(bot: Bot, api_client: ApiClient) -> Router:
     @router.message(MessageState.initial | MessageState.waiting_for_ai_input, F.text)
     @track_messages
     async def handle_ai_message(msg: Message, state: FSMContext, bot: Bot) -> Message:
-        async with ApiClient(base_url=BACKEND_URL) as api_client:
+        async with ApiClient.instance(BACKEND_URL) as api_client:
             chat_id = msg.chat.id
             input_text = (
                 msg.text.replace("#ИИ", "")
@@ -90,7 +91,8 @@ def create_message_router(bot: Bot, api_client: ApiClient) -> Router:
                 return await bot.send_message(chat_id, "🤔 Укажите запрос после #ИИ")
 
             await delete_tracked_messages(bot, state, chat_id)
-            await state.update_data(agent_state=None, input_text=input_text, timer_tasks=[])
+            cancel_message_expiry(chat_id)
+            await state.update_data(agent_state=None, input_text=input_text)
 
             status = await bot.send_message(
                 chat_id=chat_id,
@@ -102,7 +104,7 @@ def create_message_router(bot: Bot, api_client: ApiClient) -> Router:
             )
 
             try:
-                raw_result = await process_agent_request(agent, input_text, interactive=True)
+                raw_result = await process_agent_request(agent, input_text, interactive=True, api_client=api_client)
                 result = _ensure_dict(raw_result)
                 anim.cancel()
                 return await handle_agent_result(
@@ -132,7 +134,7 @@ def create_message_router(bot: Bot, api_client: ApiClient) -> Router:
     @router.message(MessageState.initial | MessageState.waiting_for_ai_input, F.voice)
     @track_messages
     async def handle_voice(msg: Message, state: FSMContext, bot: Bot) -> Message:
-        async with ApiClient(base_url=BACKEND_URL) as api_client:
+        async with ApiClient.instance(BACKEND_URL) as api_client:
             chat_id = msg.chat.id
             await delete_tracked_messages(bot, state, chat_id)
 
@@ -144,7 +146,7 @@ def create_message_router(bot: Bot, api_client: ApiClient) -> Router:
             anim = asyncio.create_task(animate_processing(bot, chat_id, status.message_id, "Голосовой запрос"))
 
             try:
-                raw_result = await process_agent_request(agent, text, interactive=True)
+                raw_result = await process_agent_request(agent, text, interactive=True, api_client=api_client)
                 result = _ensure_dict(raw_result)
                 anim.cancel()
                 return await handle_agent_result(
@@ -174,7 +176,7 @@ def create_message_router(bot: Bot, api_client: ApiClient) -> Router:
     @router.message(MessageState.waiting_for_clarification, ~Command(commands=["start_ai", "cancel_ai"]))
     @track_messages
     async def handle_clarification(msg: Message, state: FSMContext, bot: Bot) -> Message:
-        async with ApiClient(base_url=BACKEND_URL) as api_client:
+        async with ApiClient.instance(BACKEND_URL) as api_client:
             chat_id = msg.chat.id
             clarification = msg.text.strip()
 
@@ -206,7 +208,7 @@ def create_message_router(bot: Bot, api_client: ApiClient) -> Router:
 
             try:
                 raw_result = await process_agent_request(
-                    agent, original_input, interactive=True, prev_state=agent_state
+                    agent, original_input, interactive=True, prev_state=agent_state, api_client=api_client
                 )
                 result = _ensure_dict(raw_result)
                 anim.cancel()
@@ -264,9 +266,9 @@ def create_message_router(bot: Bot, api_client: ApiClient) -> Router:
             await state.set_state(MessageState.waiting_for_ai_input)
 
         if has_confirms:
-            await state.update_data(agent_state=result.get("state"), timer_tasks=[])
+            await state.update_data(agent_state=result.get("state"))
         elif not has_clarifications:
-            await state.update_data(agent_state=None, timer_tasks=[])
+            await state.update_data(agent_state=None)
 
         # --- Сообщения агента ------------------------------------------- #
         for msg in result.get("messages", []):
@@ -327,7 +329,7 @@ def create_message_router(bot: Bot, api_client: ApiClient) -> Router:
                 parse_mode="HTML",
             )
             await state.set_state(MessageState.waiting_for_ai_input)
-            await state.update_data(agent_state=None, timer_tasks=[])
+            await state.update_data(agent_state=None)
             return await bot.send_message(chat_id, "✅ Обработка завершена", parse_mode="HTML")
 
         # --- Финальные обновления --------------------------------------- #
@@ -28,7 +28,7 @@ async def animate_deleting(bot: Bot, chat_id: int, message_id: int, base_text: s
                 )
                 await asyncio.sleep(0.5)
             except Exception as e:
-                logger.warning(f"Failed to animate deleting for message {message_id}: {e}")
+                logger.warning("Failed to animate deleting for message {}: {}", message_id, e)
                 return
 
 
@@ -39,14 +39,14 @@ def create_delete_router(bot: Bot, api_client: ApiClient):
     async def request_delete_operation(query: CallbackQuery, callback_data: DeleteOperationCallback, state: FSMContext,
                                        bot: Bot) -> None:
         if not query.message:
-            logger.warning(f"Нет сообщения в CallbackQuery от пользователя {query.from_user.id}")
+            logger.warning("Нет сообщения в CallbackQuery от пользователя {}", query.from_user.id)
             return
         user_id = query.from_user.id
         chat_id = query.message.chat.id
         message_id = query.message.message_id
         task_ids = callback_data.task_ids.split(",") if callback_data.task_ids != "noop" else []
 
-        logger.info(f"Пользователь {user_id} запросил удаление операций task_ids={task_ids}")
+        logger.info("Пользователь {} запросил удаление операций task_ids={}", user_id, task_ids)
 
         if not task_ids:
             await bot.edit_message_text(
@@ -69,21 +69,21 @@ def create_delete_router(bot: Bot, api_client: ApiClient):
         valid_task_ids = []
         for task_id in task_ids:
             if not task_id:
-                logger.warning(f"Invalid task_id: {task_id}")
+                logger.warning("Invalid task_id: {}", task_id)
                 continue
 
             try:
                 status = await api_client.get_task_status(task_id)
                 if not isinstance(status, dict):
-                    logger.error(f"Unexpected status type for task_id {task_id}: {type(status)}")
+                    logger.error("Unexpected status type for task_id {}: {}", task_id, type(status))
                     continue
                 if status.get("status") == "not_found":
-                    logger.info(f"Task {task_id} does not exist")
+                    logger.info("Task {} does not exist", task_id)
                     continue
                 valid_task_ids.append(task_id)
                 all_already_deleted = False
             except Exception as e:
-                logger.error(f"Error checking task {task_id} status: {e}")
+                logger.error("Error checking task {} status: {}", task_id, e)
                 continue
 
         if all_already_deleted:
@@ -120,14 +120,14 @@ def create_delete_router(bot: Bot, api_client: ApiClient):
     async def confirm_delete_operation(query: CallbackQuery, callback_data: ConfirmDeleteOperationCallback,
                                        state: FSMContext, bot: Bot) -> None:
         if not query.message:
-            logger.warning(f"Нет сообщения в CallbackQuery от пользователя {query.from_user.id}")
+            logger.warning("Нет сообщения в CallbackQuery от пользователя {}", query.from_user.id)
             return
         user_id = query.from_user.id
         chat_id = query.message.chat.id
         message_id = query.message.message_id
         task_ids = callback_data.task_ids.split(",") if callback_data.task_ids != "noop" else []
 
-        logger.info(f"Пользователь {user_id} подтвердил/отменил удаление операций task_ids={task_ids}")
+        logger.info("Пользователь {} подтвердил/отменил удаление операций task_ids={}", user_id, task_ids)
 
         if not task_ids:
             await bot.edit_message_text(
@@ -164,7 +164,7 @@ def create_delete_router(bot: Bot, api_client: ApiClient):
 
             for task_id in task_ids:
                 if not task_id:
-                    logger.warning(f"Skipping invalid task_id: {task_id}")
+                    logger.warning("Skipping invalid task_id: {}", task_id)
                     error_messages.append(f"Некорректный task_id: {task_id}")
                     success = False
                     continue
@@ -190,7 +190,7 @@ def create_delete_router(bot: Bot, api_client: ApiClient):
                     continue
 
                 if task_status == "not_found":
-                    logger.info(f"Task {task_id} does not exist")
+                    logger.info("Task {} does not exist", task_id)
                     continue
 
                 if task_type not in remove_methods:
@@ -207,7 +207,7 @@ def create_delete_router(bot: Bot, api_client: ApiClient):
                     response = await remove_method(task_id)
                     if response.ok and response.task_id:
                         remove_task_id = response.task_id
-                        logger.info(f"Initiated {task_type} deletion with task_id={remove_task_id} for task {task_id}")
+                        logger.info("Initiated {} deletion with task_id={} for task {}", task_type, remove_task_id, task_id)
                         # Проверяем статус задачи удаления
                         try:
                             remove_status = await api_client.get_task_status(remove_task_id)
@@ -220,7 +220,7 @@ def create_delete_router(bot: Bot, api_client: ApiClient):
                                 continue
                             if remove_status.get("status") == "completed":
                                 logger.info(
-                                    f"Успешно удалён {task_type} task_id={task_id} (remove_task_id={remove_task_id})")
+                                    "Успешно удалён {} task_id={} (remove_task_id={})", task_type, task_id, remove_task_id)
                             else:
                                 error_msg = f"Не удалось удалить {task_type} (task_id={task_id}): {remove_status.get('result', {}).get('error', 'неизвестная ошибка')}"
                                 logger.warning(error_msg)
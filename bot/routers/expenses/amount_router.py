@@ -37,9 +37,9 @@ def create_amount_router(bot: Bot, api_client: ApiClient):
                     text=f"Выбрана сумма: 💰 {html.bold(amount)} ₽",
                     reply_markup=None
                 )
-                logger.debug(f"Отредактировано сообщение {amount_message_id} с суммой {amount}")
+                logger.debug("Отредактировано сообщение {} с суммой {}", amount_message_id, amount)
             except Exception as e:
-                logger.warning(f"Не удалось отредактировать сообщение {amount_message_id}: {e}")
+                logger.warning("Не удалось отредактировать сообщение {}: {}", amount_message_id, e)
                 amount_message = await bot.send_message(
                     chat_id=message.chat.id,
                     text=f"Выбрана сумма: 💰 {html.bold(amount)} ₽",
@@ -47,7 +47,7 @@ def create_amount_router(bot: Bot, api_client: ApiClient):
                 )
                 amount_message_id = amount_message.message_id
                 await state.update_data(amount_message_id=amount_message_id)
-                logger.debug(f"Отправлено новое сообщение {amount_message_id} с суммой {amount}")
+                logger.debug("Отправлено новое сообщение {} с суммой {}", amount_message_id, amount)
 
         wallet = data.get("wallet")
         if wallet == "borrow":
@@ -94,9 +94,9 @@ def create_amount_router(bot: Bot, api_client: ApiClient):
                     text=f"Выбран коэффициент экономии: 📊 {html.bold(coefficient)}",
                     reply_markup=None
                 )
-                logger.debug(f"Отредактировано сообщение {coefficient_message_id} с коэффициентом {coefficient}")
+                logger.debug("Отредактировано сообщение {} с коэффициентом {}", coefficient_message_id, coefficient)
             except Exception as e:
-                logger.warning(f"Не удалось отредактировать сообщение {coefficient_message_id}: {e}")
+                logger.warning("Не удалось отредактировать сообщение {}: {}", coefficient_message_id, e)
                 coefficient_message = await bot.send_message(
                     chat_id=query.message.chat.id,
                     text=f"Выбран коэффициент экономии: 📊 {html.bold(coefficient)}",
@@ -104,7 +104,7 @@ def create_amount_router(bot: Bot, api_client: ApiClient):
                 )
                 await state.update_data(coefficient_message_id=coefficient_message.message_id)
                 logger.debug(
-                    f"Отправлено новое сообщение {coefficient_message.message_id} с коэффициентом {coefficient}")
+                    "Отправлено новое сообщение {} с коэффициентом {}", coefficient_message.message_id, coefficient)
 
         comment_message = await bot.send_message(
             chat_id=query.message.chat.id,
@@ -158,9 +158,9 @@ def create_amount_router(bot: Bot, api_client: ApiClient):
                     text=f"Выбран коэффициент экономии: 📊 {html.bold(coefficient)}",
                     reply_markup=None
                 )
-                logger.debug(f"Отредактировано сообщение {coefficient_message_id} с коэффициентом {coefficient}")
+                logger.debug("Отредактировано сообщение {} с коэффициентом {}", coefficient_message_id, coefficient)
             except Exception as e:
-                logger.warning(f"Не удалось отредактировать сообщение {coefficient_message_id}: {e}")
+                logger.warning("Не удалось отредактировать сообщение {}: {}", coefficient_message_id, e)
                 coefficient_message = await bot.send_message(
                     chat_id=message.chat.id,
                     text=f"Выбран коэффициент экономии: 📊 {html.bold(coefficient)}",
@@ -168,7 +168,7 @@ def create_amount_router(bot: Bot, api_client: ApiClient):
                 )
                 await state.update_data(coefficient_message_id=coefficient_message.message_id)
                 logger.debug(
-                    f"Отправлено новое сообщение {coefficient_message.message_id} с коэффициентом {coefficient}")
+                    "Отправлено новое сообщение {} с коэффициентом {}", coefficient_message.message_id, coefficient)
 
         comment_message = await bot.send_message(
             chat_id=message.chat.id,
@@ -41,7 +41,7 @@ def create_category_router(bot: Bot, api_client: ApiClient):
                 )
                 if message_id != status_message_id:
                     await state.update_data(status_message_id=message_id)
-                logger.debug(f"Создано/обновлено статусное сообщение {message_id} в чате {chat_id}")
+                logger.debug("Создано/обновлено статусное сообщение {} в чате {}", message_id, chat_id)
             else:
                 new_message = await bot.send_message(
                     chat_id=chat_id,
@@ -50,9 +50,9 @@ def create_category_router(bot: Bot, api_client: ApiClient):
                     parse_mode="HTML"
                 )
                 await state.update_data(status_message_id=new_message.message_id)
-                logger.debug(f"Создано новое статусное сообщение {new_message.message_id} в чате {chat_id}")
+                logger.debug("Создано новое статусное сообщение {} в чате {}", new_message.message_id, chat_id)
         except Exception as e:
-            logger.warning(f"Не удалось обновить статусное сообщение в чате {chat_id}: {e}")
+            logger.warning("Не удалось обновить статусное сообщение в чате {}: {}", chat_id, e)
             new_message = await bot.send_message(
                 chat_id=chat_id,
                 text=text,
@@ -60,7 +60,7 @@ def create_category_router(bot: Bot, api_client: ApiClient):
                 parse_mode="HTML"
             )
             await state.update_data(status_message_id=new_message.message_id)
-            logger.debug(f"Создано новое статусное сообщение {new_message.message_id} в чате {chat_id}")
+            logger.debug("Создано новое статусное сообщение {} в чате {}", new_message.message_id, chat_id)
 
     @category_router.callback_query(Expense.chapter_code, ChooseSectionCallback.filter(F.back == False))
     @track_messages
@@ -68,7 +68,7 @@ def create_category_router(bot: Bot, api_client: ApiClient):
         callback_data = kwargs.get("callback_data")
         if not query.message:
             logger.warning(
-                f"Нет сообщения в CallbackQuery от пользователя {query.from_user.id}, callback_data={callback_data}")
+                "Нет сообщения в CallbackQuery от пользователя {}, callback_data={}", query.from_user.id, callback_data)
             return None
         user_id = query.from_user.id
         chat_id = query.message.chat.id
@@ -78,12 +78,14 @@ def create_category_router(bot: Bot, api_client: ApiClient):
         data = await state.get_data()
         messages_to_delete = data.get("messages_to_delete", [])
 
-        logger.info(f"Пользователь {user_id} выбрал раздел '{chapter_code}' (callback_data={callback_data}), "
-                    f"message_id={message_id}, current_state={current_state}, messages_to_delete={messages_to_delete}")
+        logger.info(
+            "Пользователь {} выбрал раздел '{}' (callback_data={}), "
+            "message_id={}, current_state={}, messages_to_delete={}",
+            user_id, chapter_code, callback_data, message_id, current_state, messages_to_delete
+        )
 
         # Получаем название раздела
-        sections = await api_client.get_sections()
-        chapter_name = next((sec.name for sec in sections if sec.code == chapter_code), chapter_code)
+        chapter_name = (await api_client.get_section_map()).get(chapter_code, chapter_code)
         await state.update_data(chapter_code=chapter_code, chapter_name=chapter_name)
 
         # Создаём клавиатуру категорий
@@ -92,7 +94,7 @@ def create_category_router(bot: Bot, api_client: ApiClient):
         # Обновляем статусное сообщение с клавиатурой категорий
         await update_status_message(chat_id, state, bot, message_id, keyboard)
         await state.set_state(Expense.category_code)
-        logger.info(f"Переход в состояние Expense.category_code, обновлено сообщение {message_id}")
+        logger.info("Переход в состояние Expense.category_code, обновлено сообщение {}", message_id)
         return query.message
 
     @category_router.callback_query(Expense.chapter_code, ChooseSectionCallback.filter(F.back == True))
@@ -101,7 +103,7 @@ def create_category_router(bot: Bot, api_client: ApiClient):
         callback_data = kwargs.get("callback_data")
         if not query.message:
             logger.warning(
-                f"Нет сообщения в CallbackQuery от пользователя {query.from_user.id}, callback_data={callback_data}")
+                "Нет сообщения в CallbackQuery от пользователя {}, callback_data={}", query.from_user.id, callback_data)
             return None
         user_id = query.from_user.id
         chat_id = query.message.chat.id
@@ -110,8 +112,11 @@ def create_category_router(bot: Bot, api_client: ApiClient):
         data = await state.get_data()
         messages_to_delete = data.get("messages_to_delete", [])
 
-        logger.info(f"Пользователь {user_id} нажал 'Назад' (callback_data={callback_data}), "
-                    f"message_id={message_id}, current_state={current_state}, messages_to_delete={messages_to_delete}")
+        logger.info(
+            "Пользователь {} нажал 'Назад' (callback_data={}), "
+            "message_id={}, current_state={}, messages_to_delete={}",
+            user_id, callback_data, message_id, current_state, messages_to_delete
+        )
 
         # Очищаем данные о разделе, категории и подкатегории
         await state.update_data(chapter_code=None, chapter_name="Не выбрано",
@@ -124,27 +129,27 @@ def create_category_router(bot: Bot, api_client: ApiClient):
         # Создаём клавиатуру кошельков
         keyboard = create_wallet_keyboard()
         if not keyboard or not keyboard.inline_keyboard:
-            logger.error(f"Клавиатура create_wallet_keyboard() пуста или None в чате {chat_id}")
+            logger.error("Клавиатура create_wallet_keyboard() пуста или None в чате {}", chat_id)
             keyboard = InlineKeyboardMarkup(inline_keyboard=[])
 
         # Отправляем сообщение с клавиатурой кошельков
         try:
             await query.message.edit_text("Выберите кошелёк: 💸", reply_markup=keyboard)
-            logger.debug(f"Отредактировано сообщение {message_id} для возврата к выбору кошелька в чате {chat_id}")
+            logger.debug("Отредактировано сообщение {} для возврата к выбору кошелька в чате {}", message_id, chat_id)
             await state.update_data(wallet_message_id=message_id)
         except Exception as e:
-            logger.warning(f"Не удалось отредактировать сообщение {message_id} в чате {chat_id}: {e}")
+            logger.warning("Не удалось отредактировать сообщение {} в чате {}: {}", message_id, chat_id, e)
             wallet_message = await bot.send_message(
                 chat_id=chat_id,
                 text="Выберите кошелёк: 💸",
                 reply_markup=keyboard
             )
             await state.update_data(wallet_message_id=wallet_message.message_id)
-            logger.info(f"Отправлено новое сообщение {wallet_message.message_id} для выбора кошелька в чате {chat_id}")
+            logger.info("Отправлено новое сообщение {} для выбора кошелька в чате {}", wallet_message.message_id, chat_id)
             return wallet_message
 
         await state.set_state(Expense.wallet)
-        logger.info(f"Переход в состояние Expense.wallet, messages_to_delete={messages_to_delete}")
+        logger.info("Переход в состояние Expense.wallet, messages_to_delete={}", messages_to_delete)
         return query.message
 
     @category_router.callback_query(Expense.category_code, ChooseCategoryCallback.filter(F.back == True))
@@ -153,7 +158,7 @@ def create_category_router(bot: Bot, api_client: ApiClient):
         callback_data = kwargs.get("callback_data")
         if not query.message:
             logger.warning(
-                f"Нет сообщения в CallbackQuery от пользователя {query.from_user.id}, callback_data={callback_data}")
+                "Нет сообщения в CallbackQuery от пользователя {}, callback_data={}", query.from_user.id, callback_data)
             return None
         user_id = query.from_user.id
         chat_id = query.message.chat.id
@@ -162,8 +167,11 @@ def create_category_router(bot: Bot, api_client: ApiClient):
         data = await state.get_data()
         messages_to_delete = data.get("messages_to_delete", [])
 
-        logger.info(f"Пользователь {user_id} нажал 'Назад' (callback_data={callback_data}), "
-                    f"message_id={message_id}, current_state={current_state}, messages_to_delete={messages_to_delete}")
+        logger.info(
+            "Пользователь {} нажал 'Назад' (callback_data={}), "
+            "message_id={}, current_state={}, messages_to_delete={}",
+            user_id, callback_data, message_id, current_state, messages_to_delete
+        )
 
         # Очищаем данные о категории и подкатегории
         await state.update_data(category_code=None, category_name="Не выбрано",
@@ -175,7 +183,7 @@ def create_category_router(bot: Bot, api_client: ApiClient):
         # Обновляем статусное сообщение с клавиатурой разделов
         await update_status_message(chat_id, state, bot, message_id, keyboard)
         await state.set_state(Expense.chapter_code)
-        logger.info(f"Переход в состояние Expense.chapter_code, обновлено сообщение {message_id}")
+        logger.info("Переход в состояние Expense.chapter_code, обновлено сообщение {}", message_id)
         return query.message
 
     @category_router.callback_query(Expense.category_code, ChooseCategoryCallback.filter(F.back == False))
@@ -184,7 +192,7 @@ def create_category_router(bot: Bot, api_client: ApiClient):
         callback_data = kwargs.get("callback_data")
         if not query.message:
             logger.warning(
-                f"Нет сообщения в CallbackQuery от пользователя {query.from_user.id}, callback_data={callback_data}")
+                "Нет сообщения в CallbackQuery от пользователя {}, callback_data={}", query.from_user.id, callback_data)
             return None
         user_id = query.from_user.id
         chat_id = query.message.chat.id
@@ -195,12 +203,14 @@ def create_category_router(bot: Bot, api_client: ApiClient):
         data = await state.get_data()
         messages_to_delete = data.get("messages_to_delete", [])
 
-        logger.info(f"Пользователь {user_id} выбрал категорию '{category_code}' (callback_data={callback_data}), "
-                    f"message_id={message_id}, current_state={current_state}, messages_to_delete={messages_to_delete}")
+        logger.info(
+            "Пользователь {} выбрал категорию '{}' (callback_data={}), "
+            "message_id={}, current_state={}, messages_to_delete={}",
+            user_id, category_code, callback_data, message_id, current_state, messages_to_delete
+        )
 
         # Получаем название категории
-        categories = await api_client.get_categories(chapter_code)
-        category_name = next((cat.name for cat in categories if cat.code == category_code), category_code)
+        category_name = (await api_client.get_category_map(chapter_code)).get(category_code, category_code)
         await state.update_data(category_code=category_code, category_name=category_name)
 
         # Проверяем наличие подкатегорий
@@ -209,7 +219,7 @@ def create_category_router(bot: Bot, api_client: ApiClient):
             keyboard = await create_subcategory_keyboard(api_client, chapter_code, category_code)
             await update_status_message(chat_id, state, bot, message_id, keyboard)
             await state.set_state(Expense.subcategory_code)
-            logger.info(f"Переход в состояние Expense.subcategory_code, обновлено сообщение {message_id}")
+            logger.info("Переход в состояние Expense.subcategory_code, обновлено сообщение {}", message_id)
             return query.message
         else:
             # Обновляем статусное сообщение без клавиатуры
@@ -221,7 +231,7 @@ def create_category_router(bot: Bot, api_client: ApiClient):
             )
             await state.update_data(amount_message_id=amount_message.message_id)
             await state.set_state(Expense.amount)
-            logger.info(f"Переход в состояние Expense.amount, отправлено сообщение {amount_message.message_id}")
+            logger.info("Переход в состояние Expense.amount, отправлено сообщение {}", amount_message.message_id)
             return query.message
 
     @category_router.callback_query(Expense.subcategory_code, ChooseSubCategoryCallback.filter(F.back == True))
@@ -230,7 +240,7 @@ def create_category_router(bot: Bot, api_client: ApiClient):
         callback_data = kwargs.get("callback_data")
         if not query.message:
             logger.warning(
-                f"Нет сообщения в CallbackQuery от пользователя {query.from_user.id}, callback_data={callback_data}")
+                "Нет сообщения в CallbackQuery от пользователя {}, callback_data={}", query.from_user.id, callback_data)
             return None
         user_id = query.from_user.id
         chat_id = query.message.chat.id
@@ -240,8 +250,11 @@ def create_category_router(bot: Bot, api_client: ApiClient):
         data = await state.get_data()
         messages_to_delete = data.get("messages_to_delete", [])
 
-        logger.info(f"Пользователь {user_id} нажал 'Назад' (callback_data={callback_data}), "
-                    f"message_id={message_id}, current_state={current_state}, messages_to_delete={messages_to_delete}")
+        logger.info(
+            "Пользователь {} нажал 'Назад' (callback_data={}), "
+            "message_id={}, current_state={}, messages_to_delete={}",
+            user_id, callback_data, message_id, current_state, messages_to_delete
+        )
 
         # Очищаем данные о подкатегории
         await state.update_data(subcategory_code=None, subcategory_name="Не выбрано")
@@ -252,7 +265,7 @@ def create_category_router(bot: Bot, api_client: ApiClient):
         # Обновляем статусное сообщение с клавиатурой категорий
         await update_status_message(chat_id, state, bot, message_id, keyboard)
         await state.set_state(Expense.category_code)
-        logger.info(f"Переход в состояние Expense.category_code, обновлено сообщение {message_id}")
+        logger.info("Переход в состояние Expense.category_code, обновлено сообщение {}", message_id)
         return query.message
 
     @category_router.callback_query(Expense.subcategory_code, ChooseSubCategoryCallback.filter(F.back == False))
@@ -261,7 +274,7 @@ def create_category_router(bot: Bot, api_client: ApiClient):
         callback_data = kwargs.get("callback_data")
         if not query.message:
             logger.warning(
-                f"Нет сообщения в CallbackQuery от пользователя {query.from_user.id}, callback_data={callback_data}")
+                "Нет сообщения в CallbackQuery от пользователя {}, callback_data={}", query.from_user.id, callback_data)
             return None
         user_id = query.from_user.id
         chat_id = query.message.chat.id
@@ -273,12 +286,16 @@ def create_category_router(bot: Bot, api_client: ApiClient):
         data = await state.get_data()
         messages_to_delete = data.get("messages_to_delete", [])
 
-        logger.info(f"Пользователь {user_id} выбрал подкатегорию '{subcategory_code}' (callback_data={callback_data}), "
-                    f"message_id={message_id}, current_state={current_state}, messages_to_delete={messages_to_delete}")
+        logger.info(
+            "Пользователь {} выбрал подкатегорию '{}' (callback_data={}), "
+            "message_id={}, current_state={}, messages_to_delete={}",
+            user_id, subcategory_code, callback_data, message_id, current_state, messages_to_delete
+        )
 
         # Получаем название подкатегории
-        subcategories = await api_client.get_subcategories(chapter_code, category_code)
-        subcategory_name = next((sub.name for sub in subcategories if sub.code == subcategory_code), subcategory_code)
+        subcategory_name = (
+            await api_client.get_subcategory_map(chapter_code, category_code)
+        ).get(subcategory_code, subcategory_code)
         await state.update_data(subcategory_code=subcategory_code, subcategory_name=subcategory_name)
 
         # Обновляем статусное сообщение без клавиатуры
@@ -291,7 +308,7 @@ def create_category_router(bot: Bot, api_client: ApiClient):
         )
         await state.update_data(amount_message_id=amount_message.message_id)
         await state.set_state(Expense.amount)
-        logger.info(f"Переход в состояние Expense.amount, отправлено сообщение {amount_message.message_id}")
+        logger.info("Переход в состояние Expense.amount, отправлено сообщение {}", amount_message.message_id)
         return query.message
 
     return category_router
\ No newline at end of file
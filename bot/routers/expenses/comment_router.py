@@ -6,8 +6,7 @@ from api_client import ApiClient
 from keyboards.confirm import create_confirm_keyboard
 from routers.expenses.state_classes import Expense
 from utils.logging import configure_logger
-from utils.message_utils import track_messages, format_operation_message, delete_message, delete_key_messages, \
-    delete_tracked_messages
+from utils.message_utils import track_messages, format_operation_message, delete_message, delete_all_messages
 
 logger = configure_logger("[COMMENT]", "cyan")
 
@@ -22,7 +21,7 @@ def create_comment_router(bot: Bot, api_client: ApiClient):
         comment = message.text
         data = await state.get_data()
 
-        logger.info(f"Пользователь {user_id} добавил комментарий '{comment}'")
+        logger.info("Пользователь {} добавил комментарий '{}'", user_id, comment)
 
         # Сохраняем комментарий
         await state.update_data(comment=comment)
@@ -43,11 +42,10 @@ def create_comment_router(bot: Bot, api_client: ApiClient):
         # Удаляем сообщение пользователя
         await delete_message(bot, chat_id, message.message_id)
 
-        # Удаляем временные и ключевые сообщения, исключая новое сообщение
-        await delete_tracked_messages(bot, state, chat_id, exclude_message_id=sent_message.message_id)
-        await delete_key_messages(bot, state, chat_id, exclude_message_id=sent_message.message_id)
+        # Удаляем временные и ключевые сообщения одним пакетом
+        await delete_all_messages(bot, state, chat_id, exclude_message_id=sent_message.message_id)
 
-        logger.info(f"Переход в состояние Expense.confirm, отправлено сообщение {sent_message.message_id}")
+        logger.info("Переход в состояние Expense.confirm, отправлено сообщение {}", sent_message.message_id)
         return sent_message
 
     return comment_router
\ No newline at end of file
@@ -12,7 +12,7 @@ from keyboards.utils import ConfirmOperationCallback
 from routers.expenses.state_classes import Expense
 from utils.logging import configure_logger
 from utils.message_utils import track_messages, format_operation_message, animate_processing, check_task_status, \
-    delete_tracked_messages, send_success_message, delete_key_messages
+    delete_tracked_messages, send_success_message, delete_all_messages
 
 logger = configure_logger("[CONFIRM]", "blue")
 
@@ -24,14 +24,14 @@ def create_confirm_router(bot: Bot, api_client: ApiClient):
     @track_messages
     async def confirm_operation(query: CallbackQuery, state: FSMContext, bot: Bot) -> Message:
         if not query.message:
-            logger.warning(f"Нет сообщения в CallbackQuery от пользователя {query.from_user.id}")
+            logger.warning("Нет сообщения в CallbackQuery от пользователя {}", query.from_user.id)
             return None
         user_id = query.from_user.id
         chat_id = query.message.chat.id
         message_id = query.message.message_id
         data = await state.get_data()
 
-        logger.info(f"Пользователь {user_id} подтвердил операцию, message_id={message_id}")
+        logger.info("Пользователь {} подтвердил операцию, message_id={}", user_id, message_id)
 
         # Получаем исходное сообщение операции
         operation_info = await format_operation_message(data, api_client)
@@ -69,7 +69,7 @@ def create_confirm_router(bot: Bot, api_client: ApiClient):
                         raise ValueError("No task_id in response")
                     task_ids.append(task_id)
                 except Exception as e:
-                    logger.error(f"API error adding expense: {e}")
+                    logger.error("API error adding expense: {}", e)
                     animation_task.cancel()
                     await bot.edit_message_text(
                         chat_id=chat_id,
@@ -133,7 +133,7 @@ def create_confirm_router(bot: Bot, api_client: ApiClient):
                     if not all(task_id for task_id in task_ids):
                         raise ValueError("Missing task_id in response")
                 except Exception as e:
-                    logger.error(f"API error adding expense/borrowing: {e}")
+                    logger.error("API error adding expense/borrowing: {}", e)
                     animation_task.cancel()
                     await bot.edit_message_text(
                         chat_id=chat_id,
@@ -160,9 +160,9 @@ def create_confirm_router(bot: Bot, api_client: ApiClient):
                         if response_saving.task_id:
                             task_ids.append(response_saving.task_id)
                         else:
-                            logger.warning(f"No task_id for saving: {response_saving}")
+                            logger.warning("No task_id for saving: {}", response_saving)
                     except Exception as e:
-                        logger.error(f"API error adding saving: {e}")
+                        logger.error("API error adding saving: {}", e)
 
                 # Check all task statuses concurrently
                 task_results = await asyncio.gather(
@@ -202,7 +202,7 @@ def create_confirm_router(bot: Bot, api_client: ApiClient):
                         raise ValueError("No task_id in response")
                     task_ids.append(task_id)
                 except Exception as e:
-                    logger.error(f"API error adding repayment: {e}")
+                    logger.error("API error adding repayment: {}", e)
                     animation_task.cancel()
                     await bot.edit_message_text(
                         chat_id=chat_id,
@@ -255,7 +255,7 @@ def create_confirm_router(bot: Bot, api_client: ApiClient):
                         raise ValueError("No task_id in response")
                     task_ids.append(task_id)
                 except Exception as e:
-                    logger.error(f"API error adding dividends expense: {e}")
+                    logger.error("API error adding dividends expense: {}", e)
                     animation_task.cancel()
                     await bot.edit_message_text(
                         chat_id=chat_id,
@@ -290,7 +290,7 @@ def create_confirm_router(bot: Bot, api_client: ApiClient):
                     )
 
         except Exception as e:
-            logger.error(f"Error processing expense operation: {e}")
+            logger.error("Error processing expense operation: {}", e)
             animation_task.cancel()
             await bot.edit_message_text(
                 chat_id=chat_id,
@@ -320,21 +320,20 @@ def create_confirm_router(bot: Bot, api_client: ApiClient):
     @track_messages
     async def cancel_operation(query: CallbackQuery, state: FSMContext, bot: Bot) -> Message:
         if not query.message:
-            logger.warning(f"Нет сообщения в CallbackQuery от пользователя {query.from_user.id}")
+            logger.warning("Нет сообщения в CallbackQuery от пользователя {}", query.from_user.id)
             return None
         user_id = query.from_user.id
         chat_id = query.message.chat.id
         message_id = query.message.message_id
 
-        logger.info(f"Пользователь {user_id} отменил операцию, message_id={message_id}")
+        logger.info("Пользователь {} отменил операцию, message_id={}", user_id, message_id)
 
         # Форматируем сообщение с полной информацией
         data = await state.get_data()
         operation_info = await format_operation_message(data, api_client)
 
-        # Удаляем все сообщения
-        await delete_tracked_messages(bot, state, chat_id)
-        await delete_key_messages(bot, state, chat_id)
+        # Удаляем временные и ключевые сообщения одним пакетом
+        await delete_all_messages(bot, state, chat_id)
         await state.update_data(messages_to_delete=[])
 
         try:
@@ -346,7 +345,7 @@ def create_confirm_router(bot: Bot, api_client: ApiClient):
                 parse_mode="HTML"
             )
         except Exception as e:
-            logger.warning(f"Не удалось отредактировать сообщение {message_id}: {e}")
+            logger.warning("Не удалось отредактировать сообщение {}: {}", message_id, e)
             await bot.send_message(
                 chat_id=chat_id,
                 text=f"Добавление расхода отменено:\n{operation_info} 🚫",
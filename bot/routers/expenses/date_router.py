@@ -22,21 +22,23 @@ def create_date_router(bot: Bot, api_client: ApiClient):
         date = TodayCallback.unpack(query.data).today
         await state.update_data(date=date)
 
+        date_text = f"Выбрана дата: 🗓️ {html.bold(date)}"
+
         # Редактируем сообщение бота и сохраняем как ключевое
         try:
-            await query.message.edit_text(f"Выбрана дата: 🗓️ {html.bold(date)}", reply_markup=None)
-            logger.debug(f"Отредактировано сообщение {query.message.message_id} с датой {date}")
+            await query.message.edit_text(date_text, reply_markup=None)
+            logger.debug("Отредактировано сообщение {} с датой {}", query.message.message_id, date)
             await state.update_data(date_message_id=query.message.message_id)
         except Exception as e:
-            logger.warning(f"Не удалось отредактировать сообщение {query.message.message_id}: {e}")
+            logger.warning("Не удалось отредактировать сообщение {}: {}", query.message.message_id, e)
             # Отправляем новое сообщение
             new_message = await bot.send_message(
                 chat_id=query.message.chat.id,
-                text=f"Выбрана дата: 🗓️ {html.bold(date)}",
+                text=date_text,
                 reply_markup=None
             )
             await state.update_data(date_message_id=new_message.message_id)
-            logger.debug(f"Отправлено новое сообщение {new_message.message_id} с датой {date}")
+            logger.debug("Отправлено новое сообщение {} с датой {}", new_message.message_id, date)
 
         # Удаляем временные сообщения после сохранения ключевого
         await delete_tracked_messages(bot, state, query.message.chat.id)
@@ -61,6 +63,7 @@ def create_date_router(bot: Bot, api_client: ApiClient):
         await delete_message(bot, message.chat.id, message.message_id)
 
         # Редактируем последнее сообщение бота
+        date_text = f"Выбрана дата: 🗓️ {html.bold(date)}"
         data = await state.get_data()
         date_message_id = data.get("date_message_id")
         if date_message_id:
@@ -68,20 +71,20 @@ def create_date_router(bot: Bot, api_client: ApiClient):
                 await bot.edit_message_text(
                     chat_id=message.chat.id,
                     message_id=date_message_id,
-                    text=f"Выбрана дата: 🗓️ {html.bold(date)}",
+                    text=date_text,
                     reply_markup=None
                 )
-                logger.debug(f"Отредактировано сообщение {date_message_id} с датой {date}")
+                logger.debug("Отредактировано сообщение {} с датой {}", date_message_id, date)
             except Exception as e:
-                logger.warning(f"Не удалось отредактировать сообщение {date_message_id}: {e}")
+                logger.warning("Не удалось отредактировать сообщение {}: {}", date_message_id, e)
                 new_message = await bot.send_message(
                     chat_id=message.chat.id,
-                    text=f"Выбрана дата: 🗓️ {html.bold(date)}",
+                    text=date_text,
                     reply_markup=None
                 )
                 date_message_id = new_message.message_id
                 await state.update_data(date_message_id=date_message_id)
-                logger.debug(f"Отправлено новое сообщение {date_message_id} с датой {date}")
+                logger.debug("Отправлено новое сообщение {} с датой {}", date_message_id, date)
 
         # Удаляем временные сообщения
         await delete_tracked_messages(bot, state, message.chat.id)
@@ -29,7 +29,7 @@ def create_wallet_router(bot: Bot, api_client: ApiClient):
                             callback_data: ChooseWalletCallback) -> Message:
         if not query.message:
             logger.warning(
-                f"Нет сообщения в CallbackQuery от пользователя {query.from_user.id}, callback_data={callback_data}")
+                "Нет сообщения в CallbackQuery от пользователя {}, callback_data={}", query.from_user.id, callback_data)
             return None
         user_id = query.from_user.id
         chat_id = query.message.chat.id
@@ -40,8 +40,11 @@ def create_wallet_router(bot: Bot, api_client: ApiClient):
         data = await state.get_data()
         messages_to_delete = data.get("messages_to_delete", [])
 
-        logger.info(f"Пользователь {user_id} выбрал кошелёк '{wallet_name}' (code={wallet}), "
-                    f"message_id={message_id}, current_state={current_state}, messages_to_delete={messages_to_delete}")
+        logger.info(
+            "Пользователь {} выбрал кошелёк '{}' (code={}), "
+            "message_id={}, current_state={}, messages_to_delete={}",
+            user_id, wallet_name, wallet, message_id, current_state, messages_to_delete
+        )
 
         await state.update_data(wallet=wallet, wallet_name=wallet_name)
 
@@ -51,10 +54,10 @@ def create_wallet_router(bot: Bot, api_client: ApiClient):
         # Редактируем сообщение бота
         try:
             await query.message.edit_text(f"Выбран кошелёк: 💸 {html.bold(wallet_name)}", reply_markup=None)
-            logger.debug(f"Отредактировано сообщение {message_id} с кошельком '{wallet_name}' в чате {chat_id}")
+            logger.debug("Отредактировано сообщение {} с кошельком '{}' в чате {}", message_id, wallet_name, chat_id)
             await state.update_data(wallet_message_id=message_id)
         except Exception as e:
-            logger.warning(f"Не удалось отредактировать сообщение {message_id} в чате {chat_id}: {e}")
+            logger.warning("Не удалось отредактировать сообщение {} в чате {}: {}", message_id, chat_id, e)
             # Отправляем новое сообщение
             new_message = await bot.send_message(
                 chat_id=chat_id,
@@ -62,7 +65,7 @@ def create_wallet_router(bot: Bot, api_client: ApiClient):
                 reply_markup=None
             )
             await state.update_data(wallet_message_id=new_message.message_id)
-            logger.debug(f"Отправлено новое сообщение {new_message.message_id} с кошельком '{wallet_name}'")
+            logger.debug("Отправлено новое сообщение {} с кошельком '{}'", new_message.message_id, wallet_name)
 
         # Отправляем новое сообщение в зависимости от кошелька
         if wallet in ["project", "dividends"]:
@@ -73,7 +76,7 @@ def create_wallet_router(bot: Bot, api_client: ApiClient):
             )
             await state.update_data(status_message_id=section_message.message_id)
             await state.set_state(Expense.chapter_code)
-            logger.info(f"Переход в состояние Expense.chapter_code, отправлено сообщение {section_message.message_id}")
+            logger.info("Переход в состояние Expense.chapter_code, отправлено сообщение {}", section_message.message_id)
         elif wallet == "borrow":
             creditors = await api_client.get_creditors()
             items = [(creditor.name, creditor.code, ChooseCreditorCallback(creditor=creditor.code, back=False)) for
@@ -89,7 +92,7 @@ def create_wallet_router(bot: Bot, api_client: ApiClient):
             await state.update_data(creditor_message_id=creditor_message.message_id)
             await state.set_state(Expense.creditor_borrow)
             logger.info(
-                f"Переход в состояние Expense.creditor_borrow, отправлено сообщение {creditor_message.message_id}")
+                "Переход в состояние Expense.creditor_borrow, отправлено сообщение {}", creditor_message.message_id)
         elif wallet == "repay":
             creditors = await api_client.get_creditors()
             items = [(creditor.name, creditor.code, ChooseCreditorCallback(creditor=creditor.code, back=False)) for
@@ -105,7 +108,7 @@ def create_wallet_router(bot: Bot, api_client: ApiClient):
             await state.update_data(creditor_message_id=creditor_message.message_id)
             await state.set_state(Expense.creditor_return)
             logger.info(
-                f"Переход в состояние Expense.creditor_return, отправлено сообщение {creditor_message.message_id}")
+                "Переход в состояние Expense.creditor_return, отправлено сообщение {}", creditor_message.message_id)
 
         return query.message  # Возвращаем отредактированное сообщение как ключевое
 
@@ -115,7 +118,7 @@ def create_wallet_router(bot: Bot, api_client: ApiClient):
                                        callback_data: ChooseCreditorCallback) -> Message:
         if not query.message:
             logger.warning(
-                f"Нет сообщения в CallbackQuery от пользователя {query.from_user.id}, callback_data={callback_data}")
+                "Нет сообщения в CallbackQuery от пользователя {}, callback_data={}", query.from_user.id, callback_data)
             return None
         user_id = query.from_user.id
         chat_id = query.message.chat.id
@@ -124,8 +127,11 @@ def create_wallet_router(bot: Bot, api_client: ApiClient):
         data = await state.get_data()
         messages_to_delete = data.get("messages_to_delete", [])
 
-        logger.info(f"Пользователь {user_id} нажал 'Назад' (callback_data={callback_data}), "
-                    f"message_id={message_id}, current_state={current_state}, messages_to_delete={messages_to_delete}")
+        logger.info(
+            "Пользователь {} нажал 'Назад' (callback_data={}), "
+            "message_id={}, current_state={}, messages_to_delete={}",
+            user_id, callback_data, message_id, current_state, messages_to_delete
+        )
 
         # Удаляем временные сообщения
         await delete_tracked_messages(bot, state, chat_id)
@@ -133,28 +139,28 @@ def create_wallet_router(bot: Bot, api_client: ApiClient):
         # Создаём клавиатуру
         keyboard = create_wallet_keyboard()
         if not keyboard or not keyboard.inline_keyboard:
-            logger.error(f"Клавиатура create_wallet_keyboard() пуста или None в чате {chat_id}")
+            logger.error("Клавиатура create_wallet_keyboard() пуста или None в чате {}", chat_id)
             keyboard = InlineKeyboardMarkup(inline_keyboard=[])
 
         # Пробуем отредактировать сообщение
         try:
             await query.message.edit_text("Выберите кошелёк: 💸", reply_markup=keyboard)
-            logger.debug(f"Отредактировано сообщение {message_id} для возврата к выбору кошелька в чате {chat_id}")
+            logger.debug("Отредактировано сообщение {} для возврата к выбору кошелька в чате {}", message_id, chat_id)
             await state.update_data(wallet_message_id=message_id)
         except Exception as e:
-            logger.warning(f"Не удалось отредактировать сообщение {message_id} в чате {chat_id}: {e}")
+            logger.warning("Не удалось отредактировать сообщение {} в чате {}: {}", message_id, chat_id, e)
             # Отправляем новое сообщение
             new_message = await bot.send_message(
                 chat_id=chat_id,
                 text="Выберите кошелёк: 💸",
                 reply_markup=keyboard
             )
-            logger.info(f"Отправлено новое сообщение {new_message.message_id} для выбора кошелька в чате {chat_id}")
+            logger.info("Отправлено новое сообщение {} для выбора кошелька в чате {}", new_message.message_id, chat_id)
             await state.update_data(wallet_message_id=new_message.message_id)
             return new_message
 
         await state.set_state(Expense.wallet)
-        logger.info(f"Переход в состояние Expense.wallet, messages_to_delete={messages_to_delete}")
+        logger.info("Переход в состояние Expense.wallet, messages_to_delete={}", messages_to_delete)
         return query.message
 
     @wallet_router.callback_query(Expense.creditor_borrow, ChooseCreditorCallback.filter(F.back == False))
@@ -163,7 +169,7 @@ def create_wallet_router(bot: Bot, api_client: ApiClient):
                               callback_data: ChooseCreditorCallback) -> Message:
         if not query.message:
             logger.warning(
-                f"Нет сообщения в CallbackQuery от пользователя {query.from_user.id}, callback_data={callback_data}")
+                "Нет сообщения в CallbackQuery от пользователя {}, callback_data={}", query.from_user.id, callback_data)
             return None
         user_id = query.from_user.id
         chat_id = query.message.chat.id
@@ -173,8 +179,11 @@ def create_wallet_router(bot: Bot, api_client: ApiClient):
         data = await state.get_data()
         messages_to_delete = data.get("messages_to_delete", [])
 
-        logger.info(f"Пользователь {user_id} выбрал кредитора '{creditor}' (callback_data={callback_data}), "
-                    f"message_id={message_id}, current_state={current_state}, messages_to_delete={messages_to_delete}")
+        logger.info(
+            "Пользователь {} выбрал кредитора '{}' (callback_data={}), "
+            "message_id={}, current_state={}, messages_to_delete={}",
+            user_id, creditor, callback_data, message_id, current_state, messages_to_delete
+        )
 
         await state.update_data(creditor=creditor, creditor_name=creditor)
 
@@ -184,10 +193,10 @@ def create_wallet_router(bot: Bot, api_client: ApiClient):
         # Редактируем сообщение бота
         try:
             await query.message.edit_text(f"Выбран кредитор: 👤 {html.bold(creditor)}", reply_markup=None)
-            logger.debug(f"Отредактировано сообщение {message_id} с кредитором '{creditor}' в чате {chat_id}")
+            logger.debug("Отредактировано сообщение {} с кредитором '{}' в чате {}", message_id, creditor, chat_id)
             await state.update_data(creditor_message_id=message_id)
         except Exception as e:
-            logger.warning(f"Не удалось отредактировать сообщение {message_id} в чате {chat_id}: {e}")
+            logger.warning("Не удалось отредактировать сообщение {} в чате {}: {}", message_id, chat_id, e)
             # Отправляем новое сообщение
             new_message = await bot.send_message(
                 chat_id=chat_id,
@@ -195,7 +204,7 @@ def create_wallet_router(bot: Bot, api_client: ApiClient):
                 reply_markup=None
             )
             await state.update_data(creditor_message_id=new_message.message_id)
-            logger.debug(f"Отправлено новое сообщение {new_message.message_id} с кредитором '{creditor}'")
+            logger.debug("Отправлено новое сообщение {} с кредитором '{}'", new_message.message_id, creditor)
 
         section_message = await bot.send_message(
             chat_id=chat_id,
@@ -204,7 +213,7 @@ def create_wallet_router(bot: Bot, api_client: ApiClient):
         )
         await state.update_data(status_message_id=section_message.message_id)
         await state.set_state(Expense.chapter_code)
-        logger.info(f"Переход в состояние Expense.chapter_code, отправлено сообщение {section_message.message_id}")
+        logger.info("Переход в состояние Expense.chapter_code, отправлено сообщение {}", section_message.message_id)
         return query.message
 
     @wallet_router.callback_query(Expense.creditor_return, ChooseCreditorCallback.filter(F.back == False))
@@ -213,7 +222,7 @@ def create_wallet_router(bot: Bot, api_client: ApiClient):
                                               callback_data: ChooseCreditorCallback) -> Message:
         if not query.message:
             logger.warning(
-                f"Нет сообщения в CallbackQuery от пользователя {query.from_user.id}, callback_data={callback_data}")
+                "Нет сообщения в CallbackQuery от пользователя {}, callback_data={}", query.from_user.id, callback_data)
             return None
         user_id = query.from_user.id
         chat_id = query.message.chat.id
@@ -224,8 +233,10 @@ def create_wallet_router(bot: Bot, api_client: ApiClient):
         messages_to_delete = data.get("messages_to_delete", [])
 
         logger.info(
-            f"Пользователь {user_id} выбрал кредитора для возврата долга '{creditor}' (callback_data={callback_data}), "
-            f"message_id={message_id}, current_state={current_state}, messages_to_delete={messages_to_delete}")
+            "Пользователь {} выбрал кредитора для возврата долга '{}' (callback_data={}), "
+            "message_id={}, current_state={}, messages_to_delete={}",
+            user_id, creditor, callback_data, message_id, current_state, messages_to_delete
+        )
 
         await state.update_data(creditor=creditor, creditor_name=creditor)
 
@@ -235,10 +246,10 @@ def create_wallet_router(bot: Bot, api_client: ApiClient):
         # Редактируем сообщение бота
         try:
             await query.message.edit_text(f"Возврат долга: 👤 {html.bold(creditor)}", reply_markup=None)
-            logger.debug(f"Отредактировано сообщение {message_id} с возвратом долга для '{creditor}' в чате {chat_id}")
+            logger.debug("Отредактировано сообщение {} с возвратом долга для '{}' в чате {}", message_id, creditor, chat_id)
             await state.update_data(creditor_message_id=message_id)
         except Exception as e:
-            logger.warning(f"Не удалось отредактировать сообщение {message_id} в чате {chat_id}: {e}")
+            logger.warning("Не удалось отредактировать сообщение {} в чате {}: {}", message_id, chat_id, e)
             # Отправляем новое сообщение
             new_message = await bot.send_message(
                 chat_id=chat_id,
@@ -246,7 +257,7 @@ def create_wallet_router(bot: Bot, api_client: ApiClient):
                 reply_markup=None
             )
             await state.update_data(creditor_message_id=new_message.message_id)
-            logger.debug(f"Отправлено новое сообщение {new_message.message_id} с возвратом долга для '{creditor}'")
+            logger.debug("Отправлено новое сообщение {} с возвратом долга для '{}'", new_message.message_id, creditor)
 
         amount_message = await bot.send_message(
             chat_id=chat_id,
@@ -254,7 +265,7 @@ def create_wallet_router(bot: Bot, api_client: ApiClient):
         )
         await state.update_data(amount_message_id=amount_message.message_id)
         await state.set_state(Expense.amount)
-        logger.info(f"Переход в состояние Expense.amount, отправлено сообщение {amount_message.message_id}")
+        logger.info("Переход в состояние Expense.amount, отправлено сообщение {}", amount_message.message_id)
         return query.message
 
     return wallet_router
\ No newline at end of file
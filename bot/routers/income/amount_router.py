@@ -10,6 +10,10 @@ from utils.message_utils import track_messages, delete_tracked_messages, delete_
 
 logger = configure_logger("[AMOUNT]", "orange")
 
+_MSG_AMOUNT_SELECTED = "Выбрана сумма: 💰 {} ₽"
+_MSG_ENTER_COMMENT = "Введите комментарий: 💬"
+_MSG_INVALID_AMOUNT = "Недопустимая сумма. Введите число больше 0 (разделитель: запятая). Попробуйте снова: 💰"
+
 def create_amount_router(bot: Bot, api_client: ApiClient):
     amount_router = Router()
 
@@ -30,24 +34,24 @@ def create_amount_router(bot: Bot, api_client: ApiClient):
                 amount_message = await bot.edit_message_text(
                     chat_id=message.chat.id,
                     message_id=amount_message_id,
-                    text=f"Выбрана сумма: 💰 {html.bold(amount)} ₽",
+                    text=_MSG_AMOUNT_SELECTED.format(html.bold(amount)),
                     reply_markup=None
                 )
-                logger.debug(f"Отредактировано сообщение {amount_message_id} с суммой {amount}")
+                logger.debug("Отредактировано сообщение {} с суммой {}", amount_message_id, amount)
             except Exception as e:
-                logger.warning(f"Не удалось отредактировать сообщение {amount_message_id}: {e}")
+                logger.warning("Не удалось отредактировать сообщение {}: {}", amount_message_id, e)
                 amount_message = await bot.send_message(
                     chat_id=message.chat.id,
-                    text=f"Выбрана сумма: 💰 {html.bold(amount)} ₽",
+                    text=_MSG_AMOUNT_SELECTED.format(html.bold(amount)),
                     reply_markup=None
                 )
                 amount_message_id = amount_message.message_id
                 await state.update_data(amount_message_id=amount_message_id)
-                logger.debug(f"Отправлено новое сообщение {amount_message_id} с суммой {amount}")
+                logger.debug("Отправлено новое сообщение {} с суммой {}", amount_message_id, amount)
 
         comment_message = await bot.send_message(
             chat_id=message.chat.id,
-            text="Введите комментарий: 💬"
+            text=_MSG_ENTER_COMMENT
         )
         await state.update_data(comment_message_id=comment_message.message_id)
         await state.set_state(Income.comment)
@@ -61,7 +65,7 @@ def create_amount_router(bot: Bot, api_client: ApiClient):
         await delete_tracked_messages(bot, state, message.chat.id)
         sent_message = await bot.send_message(
             chat_id=message.chat.id,
-            text="Недопустимая сумма. Введите число больше 0 (разделитель: запятая). Попробуйте снова: 💰"
+            text=_MSG_INVALID_AMOUNT
         )
         await state.update_data(amount_message_id=sent_message.message_id)
         await state.set_state(Income.amount)
@@ -10,17 +10,19 @@ from utils.message_utils import track_messages
 
 logger = configure_logger("[CATEGORY]", "purple")
 
+_MSG_CATEGORY_STATUS = "Категория: "
+_MSG_ENTER_AMOUNT = "Введите сумму дохода: 💰"
+
 
 def create_category_router(bot: Bot, api_client: ApiClient):
     category_router = Router()
 
-    async def update_status_message(chat_id: int, state: FSMContext, bot: Bot, message_id: int = None,
+    async def update_status_message(chat_id: int, bot: Bot, pending: dict, message_id: int = None,
                                     keyboard: InlineKeyboardMarkup = None) -> None:
-        data = await state.get_data()
-        status_message_id = data.get("category_message_id")
-        category_name = data.get("category_name", "Не выбрано")
+        """Обновляет статус-сообщение; id сообщения кладётся в `pending`, запись в state — за вызывающим."""
+        category_name = pending.get("category_name", "Не выбрано")
 
-        text = f"Категория: {html.bold(category_name)}"
+        text = _MSG_CATEGORY_STATUS + html.bold(category_name)
 
         try:
             if message_id:
@@ -31,9 +33,8 @@ def create_category_router(bot: Bot, api_client: ApiClient):
                     reply_markup=keyboard,
                     parse_mode="HTML"
                 )
-                if message_id != status_message_id:
-                    await state.update_data(category_message_id=message_id)
-                logger.debug(f"Создано/обновлено сообщение {message_id} в чате {chat_id}")
+                pending["category_message_id"] = message_id
+                logger.debug("Создано/обновлено сообщение {} в чате {}", message_id, chat_id)
             else:
                 new_message = await bot.send_message(
                     chat_id=chat_id,
@@ -41,46 +42,52 @@ def create_category_router(bot: Bot, api_client: ApiClient):
                     reply_markup=keyboard,
                     parse_mode="HTML"
                 )
-                await state.update_data(category_message_id=new_message.message_id)
-                logger.debug(f"Создано новое сообщение {new_message.message_id} в чате {chat_id}")
+                pending["category_message_id"] = new_message.message_id
+                logger.debug("Создано новое сообщение {} в чате {}", new_message.message_id, chat_id)
         except Exception as e:
-            logger.warning(f"Не удалось обновить сообщение в чате {chat_id}: {e}")
+            logger.warning("Не удалось обновить сообщение в чате {}: {}", chat_id, e)
             new_message = await bot.send_message(
                 chat_id=chat_id,
                 text=text,
                 reply_markup=keyboard,
                 parse_mode="HTML"
             )
-            await state.update_data(category_message_id=new_message.message_id)
-            logger.debug(f"Создано новое сообщение {new_message.message_id} в чате {chat_id}")
+            pending["category_message_id"] = new_message.message_id
+            logger.debug("Создано новое сообщение {} в чате {}", new_message.message_id, chat_id)
 
     @category_router.callback_query(Income.category_code, ChooseIncomeCategoryCallback.filter(F.back == False))
     @track_messages
     async def set_category(query: CallbackQuery, state: FSMContext, bot: Bot,
                            callback_data: ChooseIncomeCategoryCallback) -> Message:
         if not query.message:
-            logger.warning(f"Нет сообщения в CallbackQuery от пользователя {query.from_user.id}")
+            logger.warning("Нет сообщения в CallbackQuery от пользователя {}", query.from_user.id)
             return None
         user_id = query.from_user.id
         chat_id = query.message.chat.id
         message_id = query.message.message_id
         category_code = callback_data.category_code
 
-        logger.info(f"Пользователь {user_id} выбрал категорию '{category_code}'")
+        logger.info("Пользователь {} выбрал категорию '{}'", user_id, category_code)
+
+        # Апдейты чата сериализует PerChatSerializerMiddleware; повторное нажатие
+        # приходит уже после первого и отбрасывается по актуальному состоянию
+        if await state.get_state() != Income.category_code.state:
+            logger.debug("Повторный выбор категории в чате {} проигнорирован", chat_id)
+            return None
 
-        categories = await api_client.get_incomes()
-        category_name = next((cat.name for cat in categories if cat.code == category_code), category_code)
-        await state.update_data(category_code=category_code, category_name=category_name)
+        category_name = (await api_client.get_income_category_map()).get(category_code, category_code)
+        pending = {"category_code": category_code, "category_name": category_name}
 
-        await update_status_message(chat_id, state, bot, message_id)
+        await update_status_message(chat_id, bot, pending, message_id)
 
         amount_message = await bot.send_message(
             chat_id=chat_id,
-            text="Введите сумму дохода: 💰"
+            text=_MSG_ENTER_AMOUNT
         )
-        await state.update_data(amount_message_id=amount_message.message_id)
+        pending["amount_message_id"] = amount_message.message_id
+        await state.update_data(**pending)
         await state.set_state(Income.amount)
-        logger.info(f"Переход в состояние Income.amount, отправлено сообщение {amount_message.message_id}")
+        logger.info("Переход в состояние Income.amount, отправлено сообщение {}", amount_message.message_id)
         return query.message
 
     return category_router
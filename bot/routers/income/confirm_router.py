@@ -10,10 +10,14 @@ from keyboards.utils import ConfirmOperationCallback
 from routers.income.state_income import Income
 from utils.logging import configure_logger
 from utils.message_utils import format_income_message, check_task_status, animate_processing, track_messages, \
-    send_success_message, delete_tracked_messages, delete_key_messages
+    delete_tracked_messages, send_success_message, delete_all_messages
 
 logger = configure_logger("[CONFIRM]", "green")
 
+_MSG_NEXT_OP = "Выберите следующую операцию: 🔄"
+_MSG_SUCCESS_SUFFIX = "\n\n✅ Доход успешно добавлен"
+_MSG_CANCELLED_PREFIX = "Добавление дохода отменено:\n"
+
 
 def create_confirm_router(bot: Bot, api_client: ApiClient):
     confirm_router = Router()
@@ -23,18 +27,31 @@ def create_confirm_router(bot: Bot, api_client: ApiClient):
     async def confirm_operation(query: CallbackQuery, state: FSMContext, bot: Bot) -> Message:
         await query.answer()
         if not query.message:
-            logger.warning(f"Нет сообщения в CallbackQuery от пользователя {query.from_user.id}")
+            logger.warning("Нет сообщения в CallbackQuery от пользователя {}", query.from_user.id)
             return None
         user_id = query.from_user.id
         chat_id = query.message.chat.id
         message_id = query.message.message_id
+
+        # Апдейты чата сериализует PerChatSerializerMiddleware; при двойном нажатии
+        # второй вызов приходит уже после сброса состояния и выходит
+        if await state.get_state() != Income.confirm.state:
+            logger.debug("Повторное подтверждение в чате {} проигнорировано", chat_id)
+            return None
+
         data = await state.get_data()
         operation_info = await format_income_message(data, api_client)
 
-        logger.info(f"Пользователь {user_id} подтвердил операцию дохода, message_id={message_id}")
+        logger.info("Пользователь {} подтвердил операцию дохода, message_id={}", user_id, message_id)
 
         animation_task = asyncio.create_task(animate_processing(bot, chat_id, message_id, operation_info))
 
+        # Данные, которые переживают сброс состояния (нужны для удаления операции)
+        persistent_data = {
+            "operation_message_text": data.get("operation_message_text"),
+            "task_ids": data.get("task_ids")
+        }
+
         try:
             income = IncomeIn(
                 date=data.get("date"),
@@ -49,19 +66,19 @@ def create_confirm_router(bot: Bot, api_client: ApiClient):
             task_id = response.task_id
             if await check_task_status(api_client, task_id):
                 animation_task.cancel()
-                await delete_tracked_messages(bot, state, chat_id)
-                await state.update_data(messages_to_delete=[])
+                await delete_tracked_messages(bot, state, chat_id, data=data)
                 await send_success_message(
                     bot, chat_id, message_id,
-                    f"{operation_info}\n\n✅ Доход успешно добавлен",
+                    f"{operation_info}{_MSG_SUCCESS_SUFFIX}",
                     [task_id], state, operation_info
                 )
+                persistent_data = {"operation_message_text": operation_info, "task_ids": [task_id]}
                 await state.set_state(Income.delete_income)
             else:
                 raise ValueError("Task timed out or failed")
 
         except Exception as e:
-            logger.error(f"Ошибка при добавлении дохода для пользователя {user_id}: {e}")
+            logger.error("Ошибка при добавлении дохода для пользователя {}: {}", user_id, e)
             animation_task.cancel()
             await bot.edit_message_text(
                 chat_id=chat_id,
@@ -70,17 +87,13 @@ def create_confirm_router(bot: Bot, api_client: ApiClient):
                 parse_mode=ParseMode.HTML
             )
 
-        data = await state.get_data()
-        persistent_data = {
-            "operation_message_text": data.get("operation_message_text"),
-            "task_ids": data.get("task_ids")
-        }
-        await state.clear()
-        await state.update_data(**persistent_data)
+        # Сброс состояния одной записью вместо clear() + update_data()
+        await state.set_state(None)
+        await state.set_data(persistent_data)
 
         start_message = await bot.send_message(
             chat_id=chat_id,
-            text="Выберите следующую операцию: 🔄",
+            text=_MSG_NEXT_OP,
             reply_markup=create_start_kb()
         )
         return start_message
@@ -90,39 +103,45 @@ def create_confirm_router(bot: Bot, api_client: ApiClient):
     async def cancel_operation(query: CallbackQuery, state: FSMContext, bot: Bot) -> Message:
         await query.answer()
         if not query.message:
-            logger.warning(f"Нет сообщения в CallbackQuery от пользователя {query.from_user.id}")
+            logger.warning("Нет сообщения в CallbackQuery от пользователя {}", query.from_user.id)
             return None
         user_id = query.from_user.id
         chat_id = query.message.chat.id
         message_id = query.message.message_id
+
+        # Апдейты чата сериализует PerChatSerializerMiddleware; при двойном нажатии
+        # второй вызов приходит уже после сброса состояния и выходит
+        if await state.get_state() != Income.confirm.state:
+            logger.debug("Повторная отмена в чате {} проигнорирована", chat_id)
+            return None
+
         data = await state.get_data()
         operation_info = await format_income_message(data, api_client)
 
-        logger.info(f"Пользователь {user_id} отменил операцию дохода, message_id={message_id}")
+        logger.info("Пользователь {} отменил операцию дохода, message_id={}", user_id, message_id)
 
-        await delete_tracked_messages(bot, state, chat_id)
-        await delete_key_messages(bot, state, chat_id)
-        await state.update_data(messages_to_delete=[])
+        # Удаляем временные и ключевые сообщения одним пакетом
+        await delete_all_messages(bot, state, chat_id, data=data)
 
         try:
             await bot.edit_message_text(
                 chat_id=chat_id,
                 message_id=message_id,
-                text=f"Добавление дохода отменено:\n{operation_info} 🚫",
+                text=f"{_MSG_CANCELLED_PREFIX}{operation_info} 🚫",
                 parse_mode=ParseMode.HTML
             )
         except Exception as e:
-            logger.warning(f"Не удалось отредактировать сообщение {message_id}: {e}")
+            logger.warning("Не удалось отредактировать сообщение {}: {}", message_id, e)
             await bot.send_message(
                 chat_id=chat_id,
-                text=f"Добавление дохода отменено:\n{operation_info} 🚫",
+                text=f"{_MSG_CANCELLED_PREFIX}{operation_info} 🚫",
                 parse_mode=ParseMode.HTML
             )
 
         await state.clear()
         start_message = await bot.send_message(
             chat_id=chat_id,
-            text="Выберите следующую операцию: 🔄",
+            text=_MSG_NEXT_OP,
             reply_markup=create_start_kb()
         )
         return start_message
@@ -1,4 +1,7 @@
+import asyncio
+
 from aiogram import Router, Bot, html
+from aiogram.exceptions import TelegramBadRequest
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message
 
@@ -9,10 +12,14 @@ from keyboards.today import create_today_keyboard
 from keyboards.utils import TodayCallback
 from routers.income.state_income import Income
 from utils.logging import configure_logger
-from utils.message_utils import track_messages, delete_tracked_messages, delete_message
+from utils.message_utils import track_messages, delete_tracked_messages
 
 logger = configure_logger("[DATE]", "cyan")
 
+_MSG_DATE_SELECTED = "Выбрана дата: 🗓️ "
+_MSG_CHOOSE_CATEGORY = "Выберите категорию дохода: 💵"
+_MSG_INVALID_DATE = "Дата должна быть в формате дд.мм.гг или дд.мм.гггг. Повторите: 🗓️"
+
 def create_date_router(bot: Bot, api_client: ApiClient):
     date_router = Router()
 
@@ -20,30 +27,36 @@ def create_date_router(bot: Bot, api_client: ApiClient):
     @track_messages
     async def change_date(query: CallbackQuery, state: FSMContext, bot: Bot) -> Message:
         date = TodayCallback.unpack(query.data).today
-        await state.update_data(date=date)
+        date_text = _MSG_DATE_SELECTED + html.bold(date)
+        updates = {"date": date, "last_date_text": date_text}
 
         try:
-            await query.message.edit_text(f"Выбрана дата: 🗓️ {html.bold(date)}", reply_markup=None)
-            logger.debug(f"Отредактировано сообщение {query.message.message_id} с датой {date}")
-            await state.update_data(date_message_id=query.message.message_id)
+            await query.message.edit_text(date_text, reply_markup=None)
+            logger.debug("Отредактировано сообщение {} с датой {}", query.message.message_id, date)
+            updates["date_message_id"] = query.message.message_id
         except Exception as e:
-            logger.warning(f"Не удалось отредактировать сообщение {query.message.message_id}: {e}")
+            logger.warning("Не удалось отредактировать сообщение {}: {}", query.message.message_id, e)
             new_message = await bot.send_message(
                 chat_id=query.message.chat.id,
-                text=f"Выбрана дата: 🗓️ {html.bold(date)}",
+                text=date_text,
                 reply_markup=None
             )
-            await state.update_data(date_message_id=new_message.message_id)
-            logger.debug(f"Отправлено новое сообщение {new_message.message_id} с датой {date}")
-
-        await delete_tracked_messages(bot, state, query.message.chat.id)
+            updates["date_message_id"] = new_message.message_id
+            logger.debug("Отправлено новое сообщение {} с датой {}", new_message.message_id, date)
 
-        category_message = await bot.send_message(
-            chat_id=query.message.chat.id,
-            text="Выберите категорию дохода: 💵",
-            reply_markup=await create_income_category_keyboard(api_client)
+        # Клавиатуру строим заранее, затем удаление и отправка идут параллельно
+        keyboard = await create_income_category_keyboard(api_client)
+        deleted, category_message = await asyncio.gather(
+            delete_tracked_messages(bot, state, query.message.chat.id),
+            bot.send_message(chat_id=query.message.chat.id, text=_MSG_CHOOSE_CATEGORY, reply_markup=keyboard),
+            return_exceptions=True
         )
-        await state.update_data(category_message_id=category_message.message_id)
+        if isinstance(deleted, Exception):
+            logger.warning("Не удалось удалить временные сообщения: {}", deleted)
+        if isinstance(category_message, Exception):
+            raise category_message
+        updates["category_message_id"] = category_message.message_id
+        await state.update_data(**updates)
         await state.set_state(Income.category_code)
         return query.message
 
@@ -51,55 +64,67 @@ def create_date_router(bot: Bot, api_client: ApiClient):
     @track_messages
     async def set_date_text(message: Message, state: FSMContext, bot: Bot) -> Message:
         date = message.text
-        await state.update_data(date=date)
-
-        await delete_message(bot, message.chat.id, message.message_id)
+        date_text = _MSG_DATE_SELECTED + html.bold(date)
+        updates = {"date": date, "last_date_text": date_text}
 
         data = await state.get_data()
         date_message_id = data.get("date_message_id")
-        if date_message_id:
+        if date_message_id and data.get("last_date_text") == date_text:
+            logger.debug("Сообщение {} уже содержит дату {}, редактирование пропущено", date_message_id, date)
+        elif date_message_id:
             try:
                 await bot.edit_message_text(
                     chat_id=message.chat.id,
                     message_id=date_message_id,
-                    text=f"Выбрана дата: 🗓️ {html.bold(date)}",
+                    text=date_text,
                     reply_markup=None
                 )
-                logger.debug(f"Отредактировано сообщение {date_message_id} с датой {date}")
+                logger.debug("Отредактировано сообщение {} с датой {}", date_message_id, date)
             except Exception as e:
-                logger.warning(f"Не удалось отредактировать сообщение {date_message_id}: {e}")
-                new_message = await bot.send_message(
-                    chat_id=message.chat.id,
-                    text=f"Выбрана дата: 🗓️ {html.bold(date)}",
-                    reply_markup=None
-                )
-                date_message_id = new_message.message_id
-                await state.update_data(date_message_id=date_message_id)
-                logger.debug(f"Отправлено новое сообщение {date_message_id} с датой {date}")
+                if isinstance(e, TelegramBadRequest) and "message is not modified" in str(e):
+                    # Текст уже тот же — это успех, новое сообщение не нужно
+                    logger.debug("Сообщение {} не изменилось", date_message_id)
+                else:
+                    logger.warning("Не удалось отредактировать сообщение {}: {}", date_message_id, e)
+                    new_message = await bot.send_message(
+                        chat_id=message.chat.id,
+                        text=date_text,
+                        reply_markup=None
+                    )
+                    date_message_id = new_message.message_id
+                    updates["date_message_id"] = date_message_id
+                    logger.debug("Отправлено новое сообщение {} с датой {}", date_message_id, date)
 
-        await delete_tracked_messages(bot, state, message.chat.id)
-
-        category_message = await bot.send_message(
-            chat_id=message.chat.id,
-            text="Выберите категорию дохода: 💵",
-            reply_markup=await create_income_category_keyboard(api_client)
+        # Клавиатуру строим заранее, затем удаление и отправка идут параллельно
+        keyboard = await create_income_category_keyboard(api_client)
+        deleted, category_message = await asyncio.gather(
+            delete_tracked_messages(
+                bot, state, message.chat.id, include_message_ids=[message.message_id], data=data
+            ),
+            bot.send_message(chat_id=message.chat.id, text=_MSG_CHOOSE_CATEGORY, reply_markup=keyboard),
+            return_exceptions=True
         )
-        await state.update_data(category_message_id=category_message.message_id)
+        if isinstance(deleted, Exception):
+            logger.warning("Не удалось удалить временные сообщения: {}", deleted)
+        if isinstance(category_message, Exception):
+            raise category_message
+        updates["category_message_id"] = category_message.message_id
+        await state.update_data(**updates)
         await state.set_state(Income.category_code)
         return message
 
     @date_router.message(Income.date)
     @track_messages
     async def invalid_date_format(message: Message, state: FSMContext, bot: Bot) -> Message:
-        await delete_message(bot, message.chat.id, message.message_id)
-        await delete_tracked_messages(bot, state, message.chat.id)
+        # Сообщение пользователя уходит тем же пакетом, что и временные
+        await delete_tracked_messages(bot, state, message.chat.id, include_message_ids=[message.message_id])
 
         sent_message = await bot.send_message(
             chat_id=message.chat.id,
-            text="Дата должна быть в формате дд.мм.гг или дд.мм.гггг. Повторите: 🗓️",
+            text=_MSG_INVALID_DATE,
             reply_markup=create_today_keyboard()
         )
-        await state.update_data(date_message_id=sent_message.message_id)
+        await state.update_data(date_message_id=sent_message.message_id, last_date_text=None)
         await state.set_state(Income.date)
         return sent_message
 
@@ -5,7 +5,7 @@ from aiogram.types import Message
 
 from api_client import ApiClient
 from keyboards.today import create_today_keyboard
-from routers.delete_router import create_delete_router
+from middleware.chat_serializer import PerChatSerializerMiddleware
 from routers.income.amount_router import create_amount_router
 from routers.income.category_router import create_category_router
 from routers.income.comment_router import create_comment_router
@@ -13,10 +13,13 @@ from routers.income.confirm_router import create_confirm_router
 from routers.income.date_router import create_date_router
 from routers.income.state_income import Income
 from utils.logging import configure_logger
-from utils.message_utils import track_messages, delete_key_messages, delete_message, delete_tracked_messages
+from utils.message_utils import track_messages, delete_all_messages
 
 logger = configure_logger("[INCOMES]", "yellow")
 
+_MSG_CHOOSE_DATE = "Выберите дату дохода: 🗓️"
+_MSG_CANCELLED = "Добавление дохода отменено 🚫"
+
 def create_income_router(bot: Bot, api_client: ApiClient):
     income_router = Router()
 
@@ -24,21 +27,13 @@ def create_income_router(bot: Bot, api_client: ApiClient):
     @income_router.message(F.text.casefold() == "приход ₽")
     @track_messages
     async def start_income_adding(message: Message, state: FSMContext, bot: Bot) -> Message:
-        # Удаляем все отслеживаемые сообщения предыдущей операции
-        await delete_tracked_messages(bot, state, message.chat.id)
-        await delete_key_messages(bot, state, message.chat.id)
-        await state.update_data(messages_to_delete=[])
+        # Сообщение пользователя, временные и ключевые сообщения — одним пакетом
+        await delete_all_messages(bot, state, message.chat.id, include_message_ids=[message.message_id])
+        # clear() и так обнуляет данные (включая messages_to_delete) одной записью
         await state.clear()
-        # Проверяем, что messages_to_delete пустой
-        data = await state.get_data()
-        if data.get("messages_to_delete", []):
-            logger.warning(f"messages_to_delete не очищен: {data['messages_to_delete']}")
-            await state.update_data(messages_to_delete=[])
-        # Удаляем сообщение пользователя
-        await delete_message(bot, message.chat.id, message.message_id)
         sent_message = await bot.send_message(
             chat_id=message.chat.id,
-            text="Выберите дату дохода: 🗓️",
+            text=_MSG_CHOOSE_DATE,
             reply_markup=create_today_keyboard()
         )
         await state.set_state(Income.date)
@@ -48,26 +43,25 @@ def create_income_router(bot: Bot, api_client: ApiClient):
     @income_router.message(F.text.casefold() == "отмена дохода")
     @track_messages
     async def cancel_income_adding(message: Message, state: FSMContext, bot: Bot) -> Message:
-        # Удаляем сообщение пользователя
-        await delete_message(bot, message.chat.id, message.message_id)
-        # Удаляем все отслеживаемые сообщения
-        await delete_tracked_messages(bot, state, message.chat.id)
-        # Удаляем ключевые сообщения
-        await delete_key_messages(bot, state, message.chat.id)
-        await state.update_data(messages_to_delete=[])
+        # Сообщение пользователя, временные и ключевые сообщения — одним пакетом
+        await delete_all_messages(bot, state, message.chat.id, include_message_ids=[message.message_id])
         await state.clear()
         sent_message = await bot.send_message(
             chat_id=message.chat.id,
-            text="Добавление дохода отменено 🚫"
+            text=_MSG_CANCELLED
         )
         return sent_message
 
+    # Апдейты одного чата — по очереди, разных чатов — параллельно (для всех под-роутеров)
+    chat_serializer = PerChatSerializerMiddleware()
+    income_router.message.outer_middleware(chat_serializer)
+    income_router.callback_query.outer_middleware(chat_serializer)
+
     # Include sub-routers
     income_router.include_router(create_date_router(bot, api_client))
     income_router.include_router(create_category_router(bot, api_client))
     income_router.include_router(create_amount_router(bot, api_client))
     income_router.include_router(create_comment_router(bot, api_client))
     income_router.include_router(create_confirm_router(bot, api_client))
-    income_router.include_router(create_delete_router(bot, api_client))
 
     return income_router
\ No newline at end of file
@@ -5,7 +5,7 @@ from aiogram.types import Message
 
 from keyboards.start_kb import create_start_kb
 from utils.logging import configure_logger
-from utils.message_utils import delete_key_messages, delete_tracked_messages
+from utils.message_utils import delete_all_messages
 
 logger = configure_logger("[START]", "green")
 
@@ -17,11 +17,10 @@ def create_start_router(bot: Bot):
     async def start_command(message: Message, state: FSMContext, bot: Bot) -> Message:
         user_id = message.from_user.id
         chat_id = message.chat.id
-        logger.info(f"Пользователь {user_id} вызвал команду /start в чате {chat_id}")
+        logger.info("Пользователь {} вызвал команду /start в чате {}", user_id, chat_id)
 
-        # Удаляем все сообщения
-        await delete_tracked_messages(bot, state, chat_id)
-        await delete_key_messages(bot, state, chat_id)
+        # Удаляем временные и ключевые сообщения одним пакетом
+        await delete_all_messages(bot, state, chat_id)
         await state.update_data(messages_to_delete=[])
 
         # Очищаем состояние
@@ -33,7 +32,7 @@ def create_start_router(bot: Bot):
             text="Добро пожаловать! Выберите операцию: 🔄",
             reply_markup=create_start_kb()
         )
-        logger.debug(f"Отправлено начальное сообщение {start_message.message_id} в чате {chat_id}")
+        logger.debug("Отправлено начальное сообщение {} в чате {}", start_message.message_id, chat_id)
         return start_message
 
     return start_router
@@ -3,18 +3,9 @@ from loguru import logger
 
 
 def configure_logger(prefix: str, color: str):
-    """Configure loguru logger with a specific prefix and color."""
-    # Only add handler if not already configured
-    if not logger._core.handlers:
-        logger.add(
-            lambda msg: print(msg, end=""),
-            level="DEBUG",
-            format=(
-                f"<{color}>{{time:YYYY-MM-DD HH:mm:ss.SSS}}</{color}> | "
-                "<b>{level:<8}</b> | "
-                "<cyan>{name}:{function}:{line}</cyan> | "
-                f"{prefix} <b>{{message}}</b>"
-            ),
-            colorize=True
-        )
+    """
+    Return the shared loguru logger.
+    Sinks (at LOG_LEVEL) are added once in agent.utils.setup_logging(), which also
+    removes loguru's default handler; prefix and color are kept for call sites.
+    """
     return logger
@@ -2,17 +2,26 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
+from datetime import timedelta
 from functools import wraps
-from typing import Union, Optional, List
+from types import MappingProxyType
+from weakref import WeakKeyDictionary, WeakValueDictionary
+from typing import Union, Optional, List, Iterable, Callable, get_type_hints
 
 from aiogram import Bot, html
-from aiogram.exceptions import TelegramBadRequest
+from aiogram.enums import ChatAction
+from aiogram.exceptions import TelegramAPIError, TelegramBadRequest
 from aiogram.fsm.context import FSMContext
-from aiogram.types import Message, CallbackQuery
+from aiogram.types import Message, CallbackQuery, TelegramObject
 
 from api_client import ApiClient
+from config import (
+    TASK_POLL_INTERVAL, TASK_POLL_MAX_INTERVAL, TASK_POLL_BACKOFF, TASK_POLL_TIMEOUT, TASK_POLL_MAX_ATTEMPTS,
+)
 from keyboards.delete import create_delete_operation_kb
 from utils.logging import configure_logger
+from utils.ratelimit import ThrottledEditor
 
 # ------------------------------------------------------------------ #
 # 1. Логгер                                                          #
@@ -22,7 +31,8 @@ logger = configure_logger("[UTILS]", "blue")
 # ------------------------------------------------------------------ #
 # 2. Константы                                                       #
 # ------------------------------------------------------------------ #
-KEY_MESSAGE_FIELDS = {
+# Таблица только для чтения: MappingProxyType не даёт случайно изменить её во время работы
+KEY_MESSAGE_FIELDS = MappingProxyType({
     #  Expense
     "Expense:date": "date_message_id",
     "Expense:wallet": "wallet_message_id",
@@ -51,25 +61,96 @@ KEY_MESSAGE_FIELDS = {
     "AI:clarify:coefficient": "clarification_message_id",
     "AI:clarify:comment": "clarification_message_id",
     "AI:confirm": "confirmation_message_id",
+})
+
+# Поля state с id ключевых сообщений (пересекаются с data.keys() без цикла по полям)
+_KEY_FIELDS = frozenset(KEY_MESSAGE_FIELDS.values())
+
+# Telegram deleteMessages принимает не более 100 id за запрос
+_DELETE_BATCH_SIZE = 100
+# Сколько одиночных deleteMessage одного вызова идут параллельно (не упираемся в flood-лимит чата)
+_DELETE_FALLBACK_CONCURRENCY = 10
+# Сколько последних временных сообщений помнить в state: список не растёт без предела,
+# а вытесненные из него старые id сразу отправляются на удаление (см. _cap_tracked)
+_MAX_TRACKED_MESSAGES = 100
+
+# CAS для данных FSM в Redis: запись только если значение не изменилось с момента чтения.
+# ARGV[3] — data_ttl хранилища в секундах (пусто — без срока), как в RedisStorage.set_data
+_REDIS_CAS_SCRIPT = """
+local current = redis.call('GET', KEYS[1]) or ''
+if current ~= ARGV[1] then
+    return 0
+end
+if ARGV[2] == '' then
+    redis.call('DEL', KEYS[1])
+elseif ARGV[3] == '' then
+    redis.call('SET', KEYS[1], ARGV[2])
+else
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+end
+return 1
+"""
+_REDIS_CAS_ATTEMPTS = 5
+# Скрипт CAS, зарегистрированный один раз на клиент Redis
+_redis_cas_scripts: WeakKeyDictionary = WeakKeyDictionary()
+
+# Правки одного сообщения не чаще раза в секунду, промежуточные тексты отбрасываются
+_editor = ThrottledEditor(cooldown=1.0)
+
+# Индикатор «печатает…» гаснет через ~5 с, поэтому обновляем его чуть раньше
+_CHAT_ACTION_INTERVAL = 4.5
+
+# Названия кошельков и группы кошельков для карточки операции
+_WALLET_NAMES = {
+    "project": "Проект",
+    "borrow": "Взять в долг",
+    "repay": "Вернуть долг",
 }
+_CREDITOR_WALLETS = frozenset({"borrow", "repay", "Взять в долг", "Вернуть долг"})
+_BORROW_WALLETS = frozenset({"borrow", "Взять в долг"})
+
+# Подписи строк в карточке операции
+_LABEL_DATE = "Дата: 🗓️ "
+_LABEL_CATEGORY = "Категория: 🏷️ "
+_LABEL_AMOUNT = "Сумма: 💰 "
+_LABEL_COMMENT = "Комментарий: 💬 "
+_RUB_SUFFIX = " ₽"
+
+# Строки карточки расхода/долга по порядку: (подпись, суффикс после значения)
+_OPERATION_LINES = (
+    (_LABEL_DATE, ""),
+    ("Кошелёк: 💸 ", ""),
+    ("Раздел: 📕 ", ""),
+    (_LABEL_CATEGORY, ""),
+    ("Подкатегория: 🏷️ ", ""),
+    ("Кредитор: 👤 ", ""),
+    ("Коэффициент: 📊 ", ""),
+    (_LABEL_AMOUNT, _RUB_SUFFIX),
+    (_LABEL_COMMENT, ""),
+)
 
 # ------------------------------------------------------------------ #
 # 3. Анимация «…»                                                    #
 # ------------------------------------------------------------------ #
 async def animate_processing(bot: Bot, chat_id: int, message_id: int, base_text: str) -> None:
-    dots = [".", "..", "..."]
-    while True:
-        for d in dots:
-            try:
-                await bot.edit_message_text(
-                    chat_id=chat_id,
-                    message_id=message_id,
-                    text=f"{base_text}\n\n⏳ Обрабатываем операцию{d} ",
-                    parse_mode="HTML",
-                )
-                await asyncio.sleep(0.5)
-            except Exception:
-                return  # любое исключение = остановить анимацию
+    """
+    Один раз дописывает к сообщению «⏳ Обрабатываем операцию…», дальше анимацию
+    рисует сам Telegram — статус «печатает», обновляемый каждые _CHAT_ACTION_INTERVAL с.
+    Работает до отмены задачи.
+    """
+    try:
+        await _editor.edit_text(
+            bot, chat_id, message_id,
+            f"{base_text}\n\n⏳ Обрабатываем операцию…",
+            parse_mode="HTML",
+        )
+        while True:
+            await bot.send_chat_action(chat_id=chat_id, action=ChatAction.TYPING)
+            await asyncio.sleep(_CHAT_ACTION_INTERVAL)
+    except TelegramAPIError as e:
+        # Сообщение удалено, flood control, сеть — анимация не критична, просто останавливаем.
+        # Отмена задачи (CancelledError) проходит насквозь
+        logger.debug("Анимация в чате {} остановлена: {}", chat_id, e)
 
 
 # ------------------------------------------------------------------ #
@@ -86,31 +167,35 @@ async def send_success_message(
 ) -> None:
     valid_task_ids = [tid for tid in task_ids if tid]
     data = await state.get_data()
-    messages_to_delete = data.get("messages_to_delete", []).copy()
+    messages_to_delete = data.get("messages_to_delete") or []
+    updates = {"operation_message_text": operation_info, "task_ids": valid_task_ids}
 
-    # Удаляем message_id из списка временных сообщений
+    # Удаляем message_id из списка временных сообщений; список копируется и пишется, только если он меняется
     if message_id in messages_to_delete:
-        messages_to_delete.remove(message_id)
-        logger.debug(f"Удалено подтверждённое сообщение {message_id} из messages_to_delete")
+        updates["messages_to_delete"] = [msg_id for msg_id in messages_to_delete if msg_id != message_id]
+        logger.debug("Удалено подтверждённое сообщение {} из messages_to_delete", message_id)
 
-    await state.update_data(
-        operation_message_text=operation_info,
-        task_ids=valid_task_ids,
-        messages_to_delete=messages_to_delete,
-    )
+    await state.update_data(**updates)
+    keyboard = create_delete_operation_kb(valid_task_ids, confirm=False)
+    # Итог не ждёт окна редактора и не может быть перезаписан запоздавшей промежуточной правкой
+    _editor.finish(chat_id, message_id)
     try:
         await bot.edit_message_text(
             chat_id=chat_id,
             message_id=message_id,
             text=text,
-            reply_markup=create_delete_operation_kb(valid_task_ids, confirm=False),
+            reply_markup=keyboard,
             parse_mode="HTML",
         )
-    except Exception:
+    except TelegramBadRequest as e:
+        if "message is not modified" in str(e):
+            return  # сообщение уже в нужном виде
+        # Сообщение удалено или его нельзя редактировать — отправляем новое
+        logger.debug("Не удалось отредактировать сообщение {}: {}", message_id, e)
         await bot.send_message(
             chat_id=chat_id,
             text=text,
-            reply_markup=create_delete_operation_kb(valid_task_ids, confirm=False),
+            reply_markup=keyboard,
             parse_mode="HTML",
         )
 
@@ -126,11 +211,7 @@ async def format_operation_message(
     """Составляет красивый текст операции (расход/долг)."""
     date = data.get("date", "")
     wallet_code = data.get("wallet", "")
-    wallet_name = {
-        "project": "Проект",
-        "borrow": "Взять в долг",
-        "repay": "Вернуть долг",
-    }.get(wallet_code, wallet_code)
+    wallet_name = _WALLET_NAMES.get(wallet_code, wallet_code)
 
     sec_code = data.get("chapter_code", "")
     cat_code = data.get("category_code", "")
@@ -142,61 +223,53 @@ async def format_operation_message(
     creditor_name = data.get("creditor_name", creditor)
     coefficient = data.get("coefficient", 1.0)
 
-    # Читаем названия из БД/АПИ
+    # Читаем названия из БД/АПИ: справочники независимы друг от друга — запрашиваем их одновременно.
+    # Уровень ниже раздела без кода родителя не ищем: такой запрос заведомо пустой
     section_name = category_name = subcategory_name = ""
-    try:
+    need_category = bool(sec_code and cat_code)
+    need_subcategory = bool(need_category and sub_code)
+    lookups = {}
+    if sec_code:
+        lookups["section"] = api_client.get_section_map()
+    if need_category:
+        lookups["category"] = api_client.get_category_map(sec_code)
+    if need_subcategory:
+        lookups["subcategory"] = api_client.get_subcategory_map(sec_code, cat_code)
+    if creditor:
+        lookups["creditor"] = api_client.get_creditor_map()
+    if lookups:  # первые шаги (дата, кошелёк) обходятся без справочников
+        names = dict(zip(lookups, await asyncio.gather(*lookups.values(), return_exceptions=True)))
+        for key, result in names.items():
+            if isinstance(result, Exception):
+                logger.warning("Не смог получить метаданные ({}): {}", key, result)
+                names[key] = {}
         if sec_code:
-            section_name = next(
-                (s.name for s in await api_client.get_sections() if s.code == sec_code),
-                "",
-            )
-        if cat_code:
-            category_name = next(
-                (
-                    c.name
-                    for c in await api_client.get_categories(sec_code)
-                    if c.code == cat_code
-                ),
-                "",
-            )
-        if sub_code:
-            subcategory_name = next(
-                (
-                    s.name
-                    for s in await api_client.get_subcategories(sec_code, cat_code)
-                    if s.code == sub_code
-                ),
-                "",
-            )
+            section_name = names["section"].get(sec_code, "")
+        if need_category:
+            category_name = names["category"].get(cat_code, "")
+        if need_subcategory:
+            subcategory_name = names["subcategory"].get(sub_code, "")
         if creditor:
-            creditor_name = next(
-                (c.name for c in await api_client.get_creditors() if c.code == creditor),
-                creditor,
-            )
-    except Exception as e:
-        logger.warning(f"Не смог получить метаданные: {e}")
-
-    lines: list[str] = []
-    if date:
-        lines.append(f"Дата: 🗓️ {html.code(date)}")
-    if wallet_name:
-        lines.append(f"Кошелёк: 💸 {html.code(wallet_name)}")
-    if section_name:
-        lines.append(f"Раздел: 📕 {html.code(section_name)}")
-    if category_name:
-        lines.append(f"Категория: 🏷️ {html.code(category_name)}")
-    if subcategory_name:
-        lines.append(f"Подкатегория: 🏷️ {html.code(subcategory_name)}")
-    if creditor_name and wallet_code in ("borrow", "repay", "Взять в долг", "Вернуть долг"):
-        lines.append(f"Кредитор: 👤 {html.code(creditor_name)}")
-    if coefficient != 1.0 and wallet_code in ("borrow", "Взять в долг"):
-        lines.append(f"Коэффициент: 📊 {html.code(coefficient)}")
-    if amount is not None:
-        lines.append(f"Сумма: 💰 {html.code(amount)} ₽")
-    if comment:
-        lines.append(f"Комментарий: 💬 {html.code(comment)}")
+            creditor_name = names["creditor"].get(creditor, creditor)
+
+    # None / "" — строка не выводится (сумма 0 выводится)
+    values = (
+        date,
+        wallet_name,
+        section_name,
+        category_name,
+        subcategory_name,
+        creditor_name if wallet_code in _CREDITOR_WALLETS else None,
+        coefficient if coefficient != 1.0 and wallet_code in _BORROW_WALLETS else None,
+        amount,
+        comment,
+    )
+    fragments: list[str] = []
+    for (label, suffix), value in zip(_OPERATION_LINES, values):
+        if value is not None and value != "":
+            fragments += (label, html.code(value), suffix, "\n")
 
-    return "\n".join(lines)
+    return "".join(fragments[:-1])  # без завершающего перевода строки
 
 
 async def format_income_message(data: dict, api_client: ApiClient) -> str:
@@ -209,22 +282,21 @@ async def format_income_message(data: dict, api_client: ApiClient) -> str:
     category_name = ""
     try:
         if category_code:
-            categories = await api_client.get_incomes()
-            category_name = next((cat.name for cat in categories if cat.code == category_code), category_code)
+            category_name = (await api_client.get_income_category_map()).get(category_code, category_code)
     except Exception as e:
-        logger.warning(f"Error retrieving category name: {e}")
+        logger.warning("Error retrieving category name: {}", e)
 
-    message_lines = []
+    fragments: list[str] = []
     if date:
-        message_lines.append(f"Дата: 🗓️ {html.code(date)}")
+        fragments += (_LABEL_DATE, html.code(date), "\n")
     if category_name:
-        message_lines.append(f"Категория: 🏷️ {html.code(category_name)}")
+        fragments += (_LABEL_CATEGORY, html.code(category_name), "\n")
     if amount:
-        message_lines.append(f"Сумма: 💰 {html.code(amount)} ₽")
+        fragments += (_LABEL_AMOUNT, html.code(amount), _RUB_SUFFIX, "\n")
     if comment:
-        message_lines.append(f"Комментарий: 💬 {html.code(comment)}")
+        fragments += (_LABEL_COMMENT, html.code(comment), "\n")
 
-    return "\n".join(message_lines)
+    return "".join(fragments[:-1])  # без завершающего перевода строки
 
 
 # ------------------------------------------------------------------ #
@@ -238,63 +310,154 @@ async def delete_message(bot: Bot, chat_id: int, message_id: int) -> bool:
     """
     try:
         await bot.delete_message(chat_id=chat_id, message_id=message_id)
-        logger.debug(f"Удалено сообщение {message_id} в чате {chat_id}")
+        logger.debug("Удалено сообщение {} в чате {}", message_id, chat_id)
         return True
     except TelegramBadRequest as e:
         # Сообщение уже удалено кем-то или ботом раньше – считаем успехом
-        if "message to delete not found" in str(e):
-            logger.debug(f"Сообщение {message_id} в чате {chat_id} уже отсутствует")
+        if "message to delete not found" in e.message:
+            logger.debug("Сообщение {} в чате {} уже отсутствует", message_id, chat_id)
             return True
-        logger.warning(f"Не удалось удалить сообщение {message_id} в чате {chat_id}: {e}")
+        logger.warning("Не удалось удалить сообщение {} в чате {}: {}", message_id, chat_id, e.message)
         return False
-    except Exception as e:
-        logger.warning(f"Не удалось удалить сообщение {message_id} в чате {chat_id}: {e}")
+    except TelegramAPIError as e:  # сеть, flood control и прочие ошибки Bot API
+        logger.warning("Не удалось удалить сообщение {} в чате {}: {}", message_id, chat_id, e)
         return False
 
 
+async def delete_messages(bot: Bot, chat_id: int, message_ids: Iterable[int]) -> set[int]:
+    """
+    Удаляет сообщения пакетами через deleteMessages (до 100 id за запрос).
+    Возвращает id, которые удалены или уже отсутствовали.
+    Пакеты отправляются параллельно; если пакет отклонён,
+    его сообщения удаляются по одному — параллельно, но не больше
+    _DELETE_FALLBACK_CONCURRENCY запросов одновременно.
+    """
+    ids = list(dict.fromkeys(msg_id for msg_id in message_ids if msg_id))
+    fallback_slots = asyncio.Semaphore(_DELETE_FALLBACK_CONCURRENCY)
+
+    async def _delete_one(msg_id: int) -> bool:
+        async with fallback_slots:
+            return await delete_message(bot, chat_id, msg_id)
+
+    async def _delete_batch(batch: list[int]) -> list[int]:
+        try:
+            if await bot.delete_messages(chat_id=chat_id, message_ids=batch):
+                return batch
+        except TelegramBadRequest as e:
+            logger.debug("Пакетное удаление {} в чате {} не удалось: {}", batch, chat_id, e)
+        # delete_message сам перехватывает ошибки, return_exceptions не нужен
+        results = await asyncio.gather(*(_delete_one(msg_id) for msg_id in batch))
+        return [msg_id for msg_id, ok in zip(batch, results) if ok]
+
+    batches = await asyncio.gather(*(
+        _delete_batch(ids[start:start + _DELETE_BATCH_SIZE])
+        for start in range(0, len(ids), _DELETE_BATCH_SIZE)
+    ))
+    return {msg_id for batch in batches for msg_id in batch}
+
+
+def _cap_tracked(tracked: list[int], evicted: list[int]) -> list[int]:
+    """
+    Оставляет в списке последние _MAX_TRACKED_MESSAGES id; вытесненные кладёт в `evicted`,
+    чтобы вызывающий удалил их из чата (иначе они остались бы там навсегда).
+    """
+    overflow = len(tracked) - _MAX_TRACKED_MESSAGES
+    if overflow <= 0:
+        return tracked
+    evicted[:] = tracked[:overflow]
+    return tracked[overflow:]
+
+
+async def _update_data_atomic(state: FSMContext, mutate: Callable[[dict], Optional[dict]]) -> None:
+    """
+    Применяет `mutate` к актуальным данным state без потери параллельных записей.
+    В RedisStorage — GET + Lua-CAS (повтор при конкурентном изменении),
+    в остальных хранилищах — обычные get_data/set_data.
+    Если `mutate` вернул None (ничего не изменилось), запись пропускается.
+    """
+    storage = state.storage
+    redis = getattr(storage, "redis", None)
+    if redis is None:
+        new_data = mutate(await state.get_data())
+        if new_data is not None:
+            await state.set_data(new_data)
+        return
+
+    redis_key = storage.key_builder.build(state.key, "data")
+    cas = _redis_cas_scripts.get(redis)
+    if cas is None:
+        cas = _redis_cas_scripts[redis] = redis.register_script(_REDIS_CAS_SCRIPT)
+    data_ttl = storage.data_ttl
+    if isinstance(data_ttl, timedelta):
+        data_ttl = int(data_ttl.total_seconds())
+    ttl_arg = str(data_ttl) if data_ttl else ""
+    for _ in range(_REDIS_CAS_ATTEMPTS):
+        raw = await redis.get(redis_key)
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        new_data = mutate(storage.json_loads(raw) if raw else {})
+        if new_data is None:
+            return
+        new_raw = storage.json_dumps(new_data) if new_data else ""
+        if await cas(keys=[redis_key], args=[raw or "", new_raw, ttl_arg]):
+            return
+        logger.debug("Данные state {} изменились во время записи, повтор", redis_key)
+    logger.warning("CAS для {} не удался за {} попыток, запись без проверки", redis_key, _REDIS_CAS_ATTEMPTS)
+    new_data = mutate(await state.get_data())
+    if new_data is not None:
+        await state.set_data(new_data)
+
+
 async def delete_tracked_messages(
         bot: Bot,
         state: FSMContext,
         chat_id: int,
         exclude_message_id: Optional[int] = None,
         exclude_confirmed: bool = True,
+        include_message_ids: Iterable[int] = (),
+        data: Optional[dict] = None,
 ) -> None:
     """
     Удаляет все временные (non-key) сообщения и
     очищает список `messages_to_delete` в state.
+    `include_message_ids` (например, сообщение пользователя) удаляются тем же пакетом.
+    `data` — уже прочитанный снимок state, чтобы не читать хранилище повторно.
     """
-    data = await state.get_data()
-    messages_to_delete = data.get("messages_to_delete", []).copy()
-    key_message_ids = [data.get(field) for field in set(KEY_MESSAGE_FIELDS.values()) if data.get(field)]
-    confirmed_message_ids = [
-        data.get("confirmation_message_id")
-        for task_id in data.get("task_ids", [])
-        if data.get("confirmation_message_id")
-    ]
+    if data is None:
+        data = await state.get_data()
+    messages_to_delete = data.get("messages_to_delete", [])
 
     if not messages_to_delete:
-        logger.debug(f"Нет временных сообщений для удаления в чате {chat_id}")
+        logger.debug("Нет временных сообщений для удаления в чате {}", chat_id)
+        if include_message_ids:
+            await _dispatch_deletes(bot, chat_id, include_message_ids)
         return
 
-    logger.debug(f"Удаление временных сообщений {messages_to_delete} в чате {chat_id}, исключая {exclude_message_id}")
-    updated_messages = messages_to_delete.copy()
+    logger.debug("Удаление временных сообщений {} в чате {}, исключая {}", messages_to_delete, chat_id, exclude_message_id)
+    # Подтверждённые / ключевые / исключённое не удаляем, но и не отслеживаем дальше.
+    # Проверка по множеству: O(1) на сообщение вместо прохода по спискам
+    keep = {data[field] for field in _KEY_FIELDS & data.keys() if data[field]}
+    keep.add(exclude_message_id)
+    if exclude_confirmed and data.get("task_ids") and data.get("confirmation_message_id"):
+        keep.add(data["confirmation_message_id"])
+    targets = [msg_id for msg_id in messages_to_delete if msg_id and msg_id not in keep]
+    deleted = await _dispatch_deletes(bot, chat_id, [*include_message_ids, *targets], state, targets)
+    # В списке остаются только те, что удалить не удалось
+    updated_messages = [msg_id for msg_id in targets if msg_id not in deleted]
+    # и те, что другие обработчики успели добавить, пока шло удаление
+    handled = set(messages_to_delete).difference(updated_messages)
+    if not handled:
+        logger.debug("Список messages_to_delete в чате {} не изменился", chat_id)
+        return
 
-    for msg_id in messages_to_delete:
-        # Пропускаем подтверждённые / ключевые / исключённое
-        if (
-                msg_id
-                and (not exclude_confirmed or msg_id not in confirmed_message_ids)
-                and msg_id not in key_message_ids
-                and msg_id != exclude_message_id
-        ):
-            if await delete_message(bot, chat_id, msg_id):
-                # «True» – удалено или не найдено → выводим из списка
-                updated_messages.remove(msg_id)
-        else:
-            updated_messages.remove(msg_id)
+    def _prune(current: dict) -> dict:
+        current["messages_to_delete"] = [
+            msg_id for msg_id in current.get("messages_to_delete", []) if msg_id not in handled
+        ]
+        return current
 
-    await state.update_data(messages_to_delete=updated_messages)
-    logger.info(f"Очищен список messages_to_delete в чате {chat_id}, новый список: {updated_messages}")
+    await _update_data_atomic(state, _prune)
+    logger.info("Очищен список messages_to_delete в чате {}, новый список: {}", chat_id, updated_messages)
 
 
 async def delete_key_messages(
@@ -302,39 +465,119 @@ async def delete_key_messages(
         state: FSMContext,
         chat_id: int,
         exclude_message_id: Optional[int] = None,
+        data: Optional[dict] = None,
 ) -> None:
     """
     Удаляет ключевые сообщения (даты, суммы, подтверждения).
+    `data` — уже прочитанный снимок state, чтобы не читать хранилище повторно.
     """
-    data = await state.get_data()
-    key_message_ids = [data.get(field) for field in set(KEY_MESSAGE_FIELDS.values()) if data.get(field)]
+    if data is None:
+        data = await state.get_data()
+    # Только заполненные поля, кроме исключённого сообщения: остальные данные state не трогаем
+    targets = {
+        field: msg_id for field in _KEY_FIELDS & data.keys()
+        if (msg_id := data[field]) and msg_id != exclude_message_id
+    }
 
-    if not key_message_ids:
-        logger.debug(f"Нет ключевых сообщений для удаления в чате {chat_id}")
+    if not targets:
+        logger.debug("Нет ключевых сообщений для удаления в чате {}", chat_id)
         return
 
-    logger.debug(f"Удаление ключевых сообщений {key_message_ids} в чате {chat_id}, исключая {exclude_message_id}")
-    update_data = {
-        field: None if data.get(field) != exclude_message_id else data.get(field)
-        for field in set(KEY_MESSAGE_FIELDS.values())
-    }
-    update_data["messages_to_delete"] = data.get("messages_to_delete", [])
+    logger.debug("Удаление ключевых сообщений {} в чате {}, исключая {}", targets, chat_id, exclude_message_id)
+    # Поля обнуляются независимо от результата: не удалённое сейчас (старше 48 ч) не удалится и позже
+    await _dispatch_deletes(bot, chat_id, targets.values())
 
-    for msg_id in key_message_ids:
-        if msg_id != exclude_message_id:
-            if await delete_message(bot, chat_id, msg_id):
-                for field in KEY_MESSAGE_FIELDS.values():
-                    if data.get(field) == msg_id:
-                        update_data[field] = None
+    await state.update_data(**dict.fromkeys(targets))
+    logger.info("Очищены ключевые сообщения в чате {}, исключая {}", chat_id, exclude_message_id)
 
-    await state.update_data(**update_data)
-    logger.info(f"Очищены ключевые сообщения в чате {chat_id}, исключая {exclude_message_id}")
+
+async def delete_all_messages(
+        bot: Bot,
+        state: FSMContext,
+        chat_id: int,
+        exclude_message_id: Optional[int] = None,
+        exclude_confirmed: bool = True,
+        include_message_ids: Iterable[int] = (),
+        data: Optional[dict] = None,
+) -> None:
+    """
+    То же, что `delete_tracked_messages` + `delete_key_messages`,
+    но временные и ключевые сообщения удаляются одним пакетом deleteMessages.
+    `include_message_ids` (например, сообщение пользователя) попадают в тот же пакет.
+    `data` — уже прочитанный снимок state, чтобы не читать хранилище повторно.
+    """
+    if data is None:
+        data = await state.get_data()
+    messages_to_delete = data.get("messages_to_delete", [])
+    # Обратный индекс: id ключевого сообщения -> поля state, где он записан
+    key_fields_by_id: dict[int, list[str]] = {}
+    for field in _KEY_FIELDS & data.keys():
+        if data[field]:
+            key_fields_by_id.setdefault(data[field], []).append(field)
+    confirmation_message_id = data.get("confirmation_message_id") if data.get("task_ids") else None
+
+    if not messages_to_delete and not key_fields_by_id:
+        logger.debug("Нет сообщений для удаления в чате {}", chat_id)
+        if include_message_ids:
+            await _dispatch_deletes(bot, chat_id, include_message_ids)
+        return
+
+    tracked_targets = [
+        msg_id for msg_id in messages_to_delete
+        if msg_id
+        and (not exclude_confirmed or msg_id != confirmation_message_id)
+        and msg_id not in key_fields_by_id
+        and msg_id != exclude_message_id
+    ]
+    key_targets = [msg_id for msg_id in key_fields_by_id if msg_id != exclude_message_id]
+    deleted = await _dispatch_deletes(
+        bot, chat_id, [*include_message_ids, *tracked_targets, *key_targets], state, tracked_targets
+    )
+
+    update_data = {field: None for msg_id in key_targets for field in key_fields_by_id[msg_id]}
+    failed = [msg_id for msg_id in tracked_targets if msg_id not in deleted]
+    handled = set(messages_to_delete).difference(failed)
+
+    def _prune(current: dict) -> dict:
+        current.update(update_data)
+        # Добавленные параллельно id сохраняем, обработанные — убираем
+        current["messages_to_delete"] = [
+            msg_id for msg_id in current.get("messages_to_delete", []) if msg_id not in handled
+        ]
+        return current
+
+    await _update_data_atomic(state, _prune)
+    logger.info("Очищены временные и ключевые сообщения в чате {}, исключая {}", chat_id, exclude_message_id)
 
 
 # ------------------------------------------------------------------ #
 # 7. Автоматическая отмена по таймеру                                #
 # ------------------------------------------------------------------ #
-async def cancel_expired_message(
+# chat_id -> {message_id: (TimerHandle, перезапуск таймера)}; задачи в FSM не хранятся
+_expiry_timers: dict[int, dict[int, tuple[asyncio.TimerHandle, Callable[[], asyncio.TimerHandle]]]] = {}
+# Сильные ссылки на запущенные отмены, чтобы их не собрал GC
+_expiry_tasks: set[asyncio.Task] = set()
+
+
+async def _expire_message(bot: Bot, chat_id: int, message_id: int, state: FSMContext) -> None:
+    """Заменяет неподтверждённое сообщение на «⌛ Время истекло» и сбрасывает запросы агента."""
+    try:
+        await _editor.edit_text(
+            bot, chat_id, message_id, "⌛ Время истекло",
+            parse_mode="HTML",
+            reply_markup=None,
+        )
+        data = await state.get_data()
+        agent_state = data.get("agent_state", {})
+        if agent_state:
+            agent_state["requests"] = []
+            await state.update_data(agent_state=agent_state)
+        logger.info("Сообщение {} в чате {} автоматически отменено по таймеру", message_id, chat_id)
+    except Exception as e:
+        logger.warning("Ошибка при автоматической отмене сообщения {}: {}", message_id, e)
+
+
+def schedule_message_expiry(
         bot: Bot,
         chat_id: int,
         message_id: int,
@@ -342,102 +585,175 @@ async def cancel_expired_message(
         timeout: int = 30,
 ) -> None:
     """
-    Через `timeout` секунд отменяет неподтверждённое сообщение.
+    Отменяет неподтверждённое сообщение после `timeout` секунд бездействия в чате.
+    Один TimerHandle на сообщение вместо спящей задачи; любое взаимодействие
+    (track_messages) перезапускает таймеры чата.
     """
-    try:
-        await asyncio.sleep(timeout)
-        data = await state.get_data()
-        if data.get("last_interaction_time", 0) + timeout <= asyncio.get_event_loop().time():
-            await bot.edit_message_text(
-                chat_id=chat_id,
-                message_id=message_id,
-                text="⌛ Время истекло",
-                parse_mode="HTML",
-                reply_markup=None,
-            )
-            agent_state = data.get("agent_state", {})
-            if agent_state:
-                agent_state["requests"] = []
-                await state.update_data(agent_state=agent_state)
-            logger.info(f"Сообщение {message_id} в чате {chat_id} автоматически отменено по таймеру")
-    except Exception as e:
-        logger.warning(f"Ошибка при автоматической отмене сообщения {message_id}: {e}")
+    loop = asyncio.get_running_loop()
+
+    def _fire() -> None:
+        cancel_message_expiry(chat_id, message_id)
+        task = loop.create_task(_expire_message(bot, chat_id, message_id, state))
+        _expiry_tasks.add(task)
+        task.add_done_callback(_expiry_tasks.discard)
+
+    def _start() -> asyncio.TimerHandle:
+        return loop.call_later(timeout, _fire)
+
+    cancel_message_expiry(chat_id, message_id)
+    _expiry_timers.setdefault(chat_id, {})[message_id] = (_start(), _start)
+
+
+def cancel_message_expiry(chat_id: int, message_id: Optional[int] = None) -> None:
+    """Снимает таймер сообщения (или все таймеры чата, если message_id не указан)."""
+    timers = _expiry_timers.get(chat_id)
+    if not timers:
+        return
+    for msg_id in (list(timers) if message_id is None else [message_id]):
+        entry = timers.pop(msg_id, None)
+        if entry:
+            entry[0].cancel()
+    if not timers:
+        del _expiry_timers[chat_id]
+
+
+def postpone_message_expiry(chat_id: int) -> None:
+    """Перезапускает таймеры чата: отсчёт бездействия начинается заново."""
+    timers = _expiry_timers.get(chat_id)
+    if not timers:
+        return
+    for msg_id, (handle, start) in timers.items():
+        handle.cancel()
+        timers[msg_id] = (start(), start)
 
 
 # ------------------------------------------------------------------ #
 # 8. Трекер сообщений                                                #
 # ------------------------------------------------------------------ #
+# (chat_id, user_id, id сообщения события, id сообщения под кнопкой — только для CallbackQuery)
+_EventInfo = tuple[int, int, int, Optional[int]]
+
+
+def _message_info(event: Message) -> Optional[_EventInfo]:
+    return event.chat.id, event.from_user.id, event.message_id, None
+
+
+def _callback_info(event: CallbackQuery) -> Optional[_EventInfo]:
+    if not event.message:
+        logger.warning("Нет сообщения в CallbackQuery от пользователя {}", event.from_user.id)
+        return None
+    message_id = event.message.message_id
+    return event.message.chat.id, event.from_user.id, message_id, message_id
+
+
+def _any_event_info(event: TelegramObject) -> Optional[_EventInfo]:
+    if isinstance(event, Message):
+        return _message_info(event)
+    if isinstance(event, CallbackQuery):
+        return _callback_info(event)
+    logger.error("Неподдерживаемый тип события: {}", type(event).__name__)
+    return None
+
+
+def _event_info_for(func: Callable) -> Callable[[TelegramObject], Optional[_EventInfo]]:
+    """
+    Выбирает разбор события по аннотации первого параметра обработчика — один раз при декорировании.
+    Без точной аннотации (Union, её отсутствие) тип проверяется на каждом событии.
+    """
+    try:
+        first_param = next(iter(inspect.signature(func).parameters))
+        annotation = get_type_hints(func).get(first_param)
+    except Exception:
+        return _any_event_info
+    return {Message: _message_info, CallbackQuery: _callback_info}.get(annotation, _any_event_info)
+
+
 def track_messages(func):
     """
     Декоратор-трекер: фиксирует все отправленные/отредактированные сообщения
     и распределяет их по ключевым / временным спискам.
     """
+    # Решается один раз при декорировании, а не на каждом событии
+    is_ai_handler = "AI" in func.__module__
+    event_info = _event_info_for(func)
+
     @wraps(func)
     async def wrapper(event: Union[Message, CallbackQuery], state: FSMContext, bot: Bot, *args, **kwargs):
         # --- идентификация события ---
-        if isinstance(event, Message):
-            chat_id = event.chat.id
-            user_id = event.from_user.id
-            event_type = "Message"
-            event_id = event.message_id
-        elif isinstance(event, CallbackQuery):
-            if not event.message:
-                logger.warning(f"Нет сообщения в CallbackQuery от пользователя {event.from_user.id}")
-                return await func(event, state, bot, *args, **kwargs)
-            chat_id = event.message.chat.id
-            user_id = event.from_user.id
-            event_type = "CallbackQuery"
-            event_id = event.message.message_id
-        else:
-            logger.error(f"Неподдерживаемый тип события: {type(event).__name__}")
+        info = event_info(event)
+        if info is None:
             return await func(event, state, bot, *args, **kwargs)
+        chat_id, user_id, event_id, callback_message_id = info
 
         current_state = await state.get_state() or "AI:default"
-        if "AI" in func.__module__ and not current_state.startswith("AI:"):
+        if is_ai_handler and not current_state.startswith("AI:"):
             current_state = "AI:clarify:default"
 
         logger.debug(
-            f"Обработка {event_type} (id={event_id}) в чате {chat_id} от пользователя {user_id}, состояние={current_state}"
+            "Обработка {} (id={}) в чате {} от пользователя {}, состояние={}",
+            type(event).__name__, event_id, chat_id, user_id, current_state
         )
 
         data = await state.get_data()
-        messages_to_delete = data.get("messages_to_delete", []).copy()
 
         # --- выполняем сам обработчик ---
         try:
             result = await func(event, state, bot, *args, **kwargs)
         except Exception as e:
-            logger.error(f"Ошибка в обработчике {func.__name__}: {e}")
+            logger.error("Ошибка в обработчике {}: {}", func.__name__, e)
             raise
 
+        if result is None:
+            logger.warning("Обработчик {} вернул None", func.__name__)
+
         # --- пост-обработка отправленных сообщений ---
         key_field = KEY_MESSAGE_FIELDS.get(current_state)
-        if isinstance(result, Message):
-            if key_field:
-                old_key_message_id = data.get(key_field)
-                if old_key_message_id and old_key_message_id != result.message_id and old_key_message_id not in messages_to_delete:
-                    messages_to_delete.append(old_key_message_id)
-                await state.update_data({key_field: result.message_id, "messages_to_delete": messages_to_delete})
-            else:
-                if result.message_id != event_id and result.message_id not in messages_to_delete:
-                    messages_to_delete.append(result.message_id)
-                    await state.update_data(messages_to_delete=messages_to_delete)
-        elif result is None:
-            logger.warning(f"Обработчик {func.__name__} вернул None")
-
-        if isinstance(event, CallbackQuery) and key_field:
-            data = await state.get_data()
-            current_key_message_id = data.get(key_field)
-            if current_key_message_id == event.message.message_id:
-                pass  # ключевое сообщение – уже учтено
-            elif event.message.message_id not in messages_to_delete and (
-                    not isinstance(result, Message) or event.message.message_id != result.message_id
-            ):
-                messages_to_delete.append(event.message.message_id)
-                await state.update_data(messages_to_delete=messages_to_delete)
-
-        # время последнего взаимодействия
-        await state.update_data(last_interaction_time=asyncio.get_event_loop().time())
+        evicted: list[int] = []
+
+        def _merge(current: dict) -> Optional[dict]:
+            evicted.clear()  # mutate может выполниться повторно (CAS)
+            # Базой служат данные *после* обработчика: его собственные правки списка не затираются
+            original = current.get("messages_to_delete", [])
+            tracked = list(original)
+            seen = set(tracked)
+            dirty = False
+
+            def _track(msg_id: int) -> None:
+                if msg_id not in seen:
+                    seen.add(msg_id)
+                    tracked.append(msg_id)
+
+            if isinstance(result, Message):
+                if key_field:
+                    old_key_message_id = data.get(key_field)
+                    if old_key_message_id and old_key_message_id != result.message_id:
+                        _track(old_key_message_id)
+                    if current.get(key_field) != result.message_id:
+                        current[key_field] = result.message_id
+                        dirty = True
+                elif result.message_id != event_id:
+                    _track(result.message_id)
+
+            if callback_message_id is not None and key_field:
+                # ключевое сообщение – уже учтено
+                if current.get(key_field) != callback_message_id and (
+                        not isinstance(result, Message) or callback_message_id != result.message_id
+                ):
+                    _track(callback_message_id)
+
+            if len(tracked) == len(original) and not dirty:
+                return None  # ничего не изменилось — запись в хранилище не нужна
+            current["messages_to_delete"] = _cap_tracked(tracked, evicted)
+            return current
+
+        # Одна запись вместо нескольких update_data/get_data подряд; без результата
+        # (и без сообщения под кнопкой) отслеживать нечего — хранилище не трогаем
+        if isinstance(result, Message) or (callback_message_id is not None and key_field):
+            await _update_data_atomic(state, _merge)
+            if evicted:
+                await _dispatch_deletes(bot, chat_id, evicted)
+        # Пользователь активен — отсчёт автоотмены начинается заново
+        postpone_message_expiry(chat_id)
 
         return result
 
@@ -447,19 +763,211 @@ def track_messages(func):
 # ------------------------------------------------------------------ #
 # 9. Проверка статуса задачи                                         #
 # ------------------------------------------------------------------ #
-async def check_task_status(api_client: ApiClient, task_id: str, max_attempts: int = 10, delay: float = 2.0) -> bool:
-    """Опрос фоновой задачи сервера."""
-    for attempt in range(max_attempts):
+# task_id -> идущий опрос; параллельные проверки одной задачи ждут один и тот же опрос
+_task_polls: dict[str, asyncio.Task[bool]] = {}
+
+
+async def check_task_status(
+        api_client: ApiClient,
+        task_id: str,
+        max_attempts: Optional[int] = None,
+        delay: Optional[float] = None,
+        timeout: Optional[float] = None,
+) -> bool:
+    """
+    Ждёт завершения фоновой задачи сервера (см. _poll_task_status).
+    Если эту задачу уже опрашивает другой обработчик, присоединяется к его опросу
+    вместо запуска второго; отмена одного ожидающего не прерывает опрос для остальных.
+    """
+    poll = _task_polls.get(task_id)
+    if poll is None:
+        poll = asyncio.create_task(_poll_task_status(api_client, task_id, max_attempts, delay, timeout))
+        _task_polls[task_id] = poll
+        poll.add_done_callback(lambda _: _task_polls.pop(task_id, None))
+    else:
+        logger.debug("Task {} уже опрашивается, ждём общий результат", task_id)
+    return await asyncio.shield(poll)
+
+
+async def _poll_task_status(
+        api_client: ApiClient,
+        task_id: str,
+        max_attempts: Optional[int] = None,
+        delay: Optional[float] = None,
+        timeout: Optional[float] = None,
+) -> bool:
+    """
+    Опрос фоновой задачи сервера с экспоненциальной паузой:
+    TASK_POLL_INTERVAL, затем ×TASK_POLL_BACKOFF до TASK_POLL_MAX_INTERVAL.
+    Короткие задачи подтверждаются быстро, длинные не засыпают шлюз запросами.
+    Опрос прекращается по терминальному статусу, после max_attempts запросов
+    или по истечении общего бюджета timeout секунд.
+    """
+    max_attempts = TASK_POLL_MAX_ATTEMPTS if max_attempts is None else max_attempts
+    delay = TASK_POLL_INTERVAL if delay is None else delay
+    timeout = TASK_POLL_TIMEOUT if timeout is None else timeout
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    attempt = 0
+    for attempt in range(1, max_attempts + 1):
         try:
             status = await api_client.get_task_status(task_id)
             if status.get("status") == "completed":
-                logger.info(f"Task {task_id} completed successfully")
+                logger.info("Task {} completed successfully after {} polls", task_id, attempt)
                 return True
             elif status.get("status") in ("failed", "error"):
-                logger.error(f"Task {task_id} failed: {status.get('error', 'Unknown error')}")
+                logger.error("Task {} failed: {}", task_id, status.get("error", "Unknown error"))
                 return False
         except Exception as e:
-            logger.warning(f"Error checking task {task_id} status: {e}")
-        await asyncio.sleep(delay)
-    logger.warning(f"Task {task_id} timed out after {max_attempts} attempts")
+            logger.warning("Error checking task {} status: {}", task_id, e)
+        remaining = deadline - loop.time()
+        if remaining <= 0 or attempt == max_attempts:
+            break
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * TASK_POLL_BACKOFF, TASK_POLL_MAX_INTERVAL)
+    logger.warning("Task {} timed out after {} attempts / {} s", task_id, attempt, timeout)
     return False
+
+
+# ------------------------------------------------------------------ #
+# 10. Блокировки по чатам                                            #
+# ------------------------------------------------------------------ #
+# Замок живёт, пока его держит хотя бы один обработчик, затем удаляется сам
+_chat_locks: WeakValueDictionary[int, asyncio.Lock] = WeakValueDictionary()
+
+
+def chat_lock(chat_id: int) -> asyncio.Lock:
+    """
+    Возвращает общий для чата asyncio.Lock.
+    Сериализует вызовы Bot API одного чата (двойное нажатие кнопки), не блокируя другие чаты.
+    """
+    lock = _chat_locks.get(chat_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _chat_locks[chat_id] = lock
+    return lock
+
+
+# ------------------------------------------------------------------ #
+# 11. Фоновое удаление сообщений                                     #
+# ------------------------------------------------------------------ #
+# Сколько ждать соседние удаления, прежде чем отправить накопленное
+_DELETE_FLUSH_DELAY = 0.25
+# Очередь (chat_id, message_id, state для возврата в messages_to_delete при ошибке или None);
+# None вместо очереди — воркер не запущен, удаляем сразу
+_delete_queue: Optional[asyncio.Queue[tuple[int, int, Optional[FSMContext]]]] = None
+
+
+async def _dispatch_deletes(
+        bot: Bot,
+        chat_id: int,
+        message_ids: Iterable[int],
+        state: Optional[FSMContext] = None,
+        tracked: Iterable[int] = (),
+) -> set[int]:
+    """
+    Передаёт удаление фоновому воркеру (обработчик не ждёт Bot API) или, если воркер
+    не запущен, удаляет сразу. Возвращает id, которые больше не нужно отслеживать.
+    С воркером это все поставленные в очередь id: те из `tracked`, что удалить
+    не удастся, воркер сам вернёт в messages_to_delete в `state`.
+    """
+    if _delete_queue is None:
+        return await delete_messages(bot, chat_id, message_ids)
+    retrack = set(tracked) if state is not None else ()
+    queued = {msg_id for msg_id in message_ids if msg_id}
+    for msg_id in queued:
+        _delete_queue.put_nowait((chat_id, msg_id, state if msg_id in retrack else None))
+    return queued
+
+
+def _retrack(failed: list[int], evicted: list[int]) -> Callable[[dict], Optional[dict]]:
+    """
+    mutate для _update_data_atomic: возвращает неудалённые id в messages_to_delete;
+    вытесненные из-за _MAX_TRACKED_MESSAGES id попадают в `evicted`.
+    """
+    def _mutate(current: dict) -> Optional[dict]:
+        evicted.clear()
+        tracked = current.get("messages_to_delete") or []
+        known = set(tracked)
+        missing = [msg_id for msg_id in failed if msg_id not in known]
+        if not missing:
+            return None
+        current["messages_to_delete"] = _cap_tracked([*tracked, *missing], evicted)
+        return current
+    return _mutate
+
+
+async def _retrack_failed(bot: Bot, state: FSMContext, chat_id: int, failed: list[int]) -> None:
+    evicted: list[int] = []
+    await _update_data_atomic(state, _retrack(failed, evicted))
+    if evicted:
+        await _dispatch_deletes(bot, chat_id, evicted)
+
+
+async def _flush_deletes(
+        bot: Bot,
+        pending: dict[int, list[int]],
+        owners: dict[tuple[int, int], FSMContext],
+) -> None:
+    """Удаляет накопленное по чатам; неудавшиеся отслеживаемые id возвращает в их state."""
+    results = await asyncio.gather(
+        *(delete_messages(bot, chat_id, ids) for chat_id, ids in pending.items()),
+        return_exceptions=True,
+    )
+    failed_by_state: dict[int, tuple[FSMContext, int, list[int]]] = {}
+    for (chat_id, ids), result in zip(pending.items(), results):
+        if isinstance(result, Exception):
+            logger.warning("Фоновое удаление в чате {} не удалось: {}", chat_id, result)
+            result = set()
+        for msg_id in ids:
+            state = owners.get((chat_id, msg_id))
+            if state is not None and msg_id not in result:
+                failed_by_state.setdefault(id(state), (state, chat_id, []))[2].append(msg_id)
+    if failed_by_state:
+        await asyncio.gather(
+            *(_retrack_failed(bot, state, chat_id, failed) for state, chat_id, failed in failed_by_state.values()),
+            return_exceptions=True,
+        )
+
+
+async def run_delete_worker(bot: Bot) -> None:
+    """
+    Фоновый воркер удаления: копит id из очереди до _DELETE_FLUSH_DELAY с
+    (или до _DELETE_BATCH_SIZE штук), группирует по чатам и удаляет пакетами deleteMessages.
+    Запускается задачей при старте бота; при отмене дочищает очередь.
+    """
+    global _delete_queue
+    queue = _delete_queue = asyncio.Queue()
+    loop = asyncio.get_running_loop()
+    pending: dict[int, list[int]] = {}
+    owners: dict[tuple[int, int], FSMContext] = {}
+
+    def _collect(item: tuple[int, int, Optional[FSMContext]]) -> None:
+        chat_id, msg_id, state = item
+        pending.setdefault(chat_id, []).append(msg_id)
+        if state is not None:
+            owners[chat_id, msg_id] = state
+
+    try:
+        while True:
+            _collect(await queue.get())
+            collected = 1
+            deadline = loop.time() + _DELETE_FLUSH_DELAY
+            while collected < _DELETE_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    _collect(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+                collected += 1
+            batch, batch_owners = pending, owners
+            pending, owners = {}, {}
+            await _flush_deletes(bot, batch, batch_owners)
+    finally:
+        _delete_queue = None
+        while not queue.empty():
+            _collect(queue.get_nowait())
+        if pending:
+            await _flush_deletes(bot, pending, owners)
@@ -0,0 +1,171 @@
+# bot/utils/ratelimit.py
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Dict, Optional
+
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+
+from utils.logging import configure_logger
+
+if TYPE_CHECKING:
+    from aiogram import Bot
+
+logger = configure_logger("[RATELIMIT]", "yellow")
+
+# Методы, которые Telegram считает «сообщениями» и ограничивает по частоте
+_THROTTLED_PREFIXES = ("send", "edit", "delete", "copy", "forward")
+# Из них лимит ~1/с на чат касается только новых сообщений; правки, удаления
+# и sendChatAction идут лишь через глобальное ведро
+_PER_CHAT_PREFIXES = ("send", "copy", "forward")
+_PER_CHAT_EXCLUDED = frozenset({"sendChatAction"})
+# После стольких корзин по чатам выкидываем простаивающие (полные)
+_CHAT_BUCKETS_PRUNE_AT = 1024
+# Номер вызова для сообщений, получивших окончательный текст (см. ThrottledEditor.finish)
+_FINISHED = -1
+
+
+class TokenBucket:
+    """Классическое ведро токенов: `rate` токенов в секунду, не больше `burst` в запасе."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()  # FIFO: ожидающие получают токены по очереди
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def is_full(self) -> bool:
+        self._refill()
+        return self._tokens >= self.capacity
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class PerChatBucket:
+    """Отдельное ведро на каждый чат; простаивающие корзины периодически удаляются."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[int | str, TokenBucket] = {}
+
+    def _prune(self) -> None:
+        for chat_id in [chat_id for chat_id, bucket in self._buckets.items() if bucket.is_full()]:
+            del self._buckets[chat_id]
+
+    async def acquire(self, chat_id: int | str) -> None:
+        bucket = self._buckets.get(chat_id)
+        if bucket is None:
+            if len(self._buckets) >= _CHAT_BUCKETS_PRUNE_AT:
+                self._prune()
+            bucket = self._buckets[chat_id] = TokenBucket(self.rate, self.burst)
+        await bucket.acquire()
+
+
+class RateLimitMiddleware(BaseRequestMiddleware):
+    """
+    Сессионный middleware Bot API: глобальный лимит ~30 запросов/с, ~1/с на чат для новых сообщений (с запасом burst),
+    а при TelegramRetryAfter — общая пауза для всех корутин и один повтор запроса.
+    """
+
+    def __init__(self, global_rate: float = 30, chat_rate: float = 1, chat_burst: float = 5):
+        self._global = TokenBucket(global_rate)
+        self._per_chat = PerChatBucket(chat_rate, chat_burst)
+        self._paused_until = 0.0
+
+    async def _wait_pause(self) -> None:
+        delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def __call__(
+            self,
+            make_request: NextRequestMiddlewareType[TelegramType],
+            bot: Bot,
+            method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        if not method.__api_method__.startswith(_THROTTLED_PREFIXES):
+            return await make_request(bot, method)
+
+        await self._wait_pause()
+        api_method = method.__api_method__
+        chat_id = getattr(method, "chat_id", None)
+        if (
+                chat_id is not None
+                and api_method.startswith(_PER_CHAT_PREFIXES)
+                and api_method not in _PER_CHAT_EXCLUDED
+        ):
+            await self._per_chat.acquire(chat_id)
+        await self._global.acquire()
+
+        try:
+            return await make_request(bot, method)
+        except TelegramRetryAfter as e:
+            self._paused_until = max(self._paused_until, time.monotonic() + e.retry_after)
+            logger.warning("Flood control на {}: пауза {} с", method.__api_method__, e.retry_after)
+            await self._wait_pause()
+            return await make_request(bot, method)
+
+
+class ThrottledEditor:
+    """
+    Правки одного сообщения не чаще раза в `cooldown` секунд (trailing edge):
+    вызов в окне ожидает его конца и отправляет правку, только если за это время
+    не пришла более свежая — промежуточные тексты отбрасываются.
+    Ошибки Bot API получает тот вызов, чья правка реально ушла.
+    """
+
+    def __init__(self, cooldown: float = 1.0):
+        self.cooldown = cooldown
+        # (chat_id, message_id) -> (момент последней правки, номер последнего вызова)
+        self._messages: Dict[tuple[int | str, int], tuple[float, int]] = {}
+
+    def _prune(self, now: float) -> None:
+        for key in [key for key, (sent_at, _) in self._messages.items() if now - sent_at >= self.cooldown]:
+            del self._messages[key]
+
+    def finish(self, chat_id: int | str, message_id: int) -> None:
+        """
+        Перед окончательной правкой мимо редактора: ожидающие правки сообщения
+        отменяются, а последующие через редактор отбрасываются.
+        """
+        self._messages[(chat_id, message_id)] = (time.monotonic(), _FINISHED)
+
+    async def edit_text(self, bot: Bot, chat_id: int | str, message_id: int, text: str, **kwargs) -> bool:
+        """Редактирует текст сообщения; False — правку вытеснил более поздний вызов или finish()."""
+        key = (chat_id, message_id)
+        now = time.monotonic()
+        sent_at, generation = self._messages.get(key, (float("-inf"), 0))
+        if generation == _FINISHED:
+            return False
+        generation += 1
+        self._messages[key] = (sent_at, generation)
+
+        delay = sent_at + self.cooldown - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+            sent_at, latest = self._messages.get(key, (sent_at, generation))
+            if latest != generation:
+                return False
+        elif len(self._messages) >= _CHAT_BUCKETS_PRUNE_AT:
+            self._prune(now)
+
+        self._messages[key] = (time.monotonic(), generation)
+        await bot.edit_message_text(chat_id=chat_id, message_id=message_id, text=text, **kwargs)
+        return True